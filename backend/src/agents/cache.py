@@ -0,0 +1,56 @@
+"""
+Async TTL cache
+===============
+Small in-process cache used to memoise expensive agent work (geocoding,
+IBEX round-trips, Bedrock calls) for repeated assessments of the same
+property. LLM outputs are stochastic and priced per call, so serving a
+recent identical assessment from memory both saves money and keeps demo
+re-runs deterministic.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class AsyncTTLCache:
+    """Bounded TTL + LRU cache with a per-key asyncio.Lock.
+
+    Callers take ``lock(key)`` around the miss path so concurrent requests
+    for the same key collapse into a single underlying call instead of a
+    thundering herd of identical fetches.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            self._locks.pop(evicted, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def lock(self, key: Hashable) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+        return lock
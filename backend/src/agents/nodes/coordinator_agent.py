@@ -34,20 +34,20 @@ def _fallback_decision(flood_score: float, planning_score: float, age_score: flo
     }
 
 
-async def coordinator_agent(state: AssessmentState) -> AssessmentState:
+async def coordinator_agent(state: AssessmentState) -> dict:
     """CoordinatorAgent: LLM-powered underwriting decision synthesis."""
     print(f"\n{'='*60}")
     print(f"[CoordinatorAgent] Initialising inputs from sub-agents")
     print(f"{'='*60}")
-    flood_score = state.get("flood_risk_score", 20.0)
-    flood_zone = state.get("flood_zone", "unknown")
-    planning_score = state.get("planning_risk_score", 10.0)
-    planning_label = state.get("planning_density_label", "unknown")
-    age_score = state.get("property_age_risk_score", 30.0)
-    age_band = state.get("property_age_band", "unknown")
-    locality_score = state.get("locality_safety_score", 25.0)
-    locality_label = state.get("locality_safety_label", "unknown")
-    policy_context = "\n\n".join(state.get("policy_context") or ["No policy guidelines available."])
+    flood_score = state.flood_risk_score
+    flood_zone = state.flood_zone
+    planning_score = state.planning_risk_score
+    planning_label = state.planning_density_label
+    age_score = state.property_age_risk_score
+    age_band = state.property_age_band
+    locality_score = state.locality_safety_score
+    locality_label = state.locality_safety_label
+    policy_context = "\n\n".join(state.policy_context or ["No policy guidelines available."])
 
     system_prompt = "You are an expert UK home insurance underwriter. Respond only with valid JSON."
     user_prompt = f"""Use these policy guidelines:
@@ -81,7 +81,7 @@ Return ONLY this JSON (no markdown):
     print(f"  planning_score = {planning_score} ({planning_label})")
     print(f"  age_score      = {age_score} ({age_band})")
     print(f"  locality_score = {locality_score} ({locality_label})")
-    print(f"  policy chunks  = {len(state.get('policy_context') or [])} loaded")
+    print(f"  policy chunks  = {len(state.policy_context)} loaded")
     print(f"{'='*60}")
     print(f"[CoordinatorAgent] Tool: AWS Bedrock invoke_model ({settings.BEDROCK_MODEL_ID})")
     print(f"[CoordinatorAgent] Prompt:\n{user_prompt[:600]}{'...' if len(user_prompt) > 600 else ''}")
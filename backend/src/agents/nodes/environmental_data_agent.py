@@ -127,10 +127,10 @@ def _score_age_band(age_band: str) -> int:
     return 30  # mid-range default when age is unknown
 
 
-async def environmental_data_agent(state: AssessmentState) -> AssessmentState:
+async def environmental_data_agent(state: AssessmentState) -> dict:
     """EnvironmentalDataAgent: fetch EPC data and score property age risk."""
     errors: list[str] = []
-    postcode = state.get("postcode", "")
+    postcode = state.postcode
 
     print(f"\n{'='*60}")
     print(f"[EnvironmentalDataAgent] Starting")
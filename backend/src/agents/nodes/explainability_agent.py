@@ -22,13 +22,13 @@ def _bedrock_client():
 
 
 def _fallback_explanation(state: AssessmentState) -> dict:
-    flood_score = state.get("flood_risk_score", 0)
-    planning_score = state.get("planning_risk_score", 0)
-    age_score = state.get("property_age_risk_score", 0)
-    locality_score = state.get("locality_safety_score", 25.0)
-    overall = state.get("overall_risk_score", 0)
-    decision = state.get("decision", "refer")
-    multiplier = state.get("premium_multiplier", 1.0)
+    flood_score = state.flood_risk_score
+    planning_score = state.planning_risk_score
+    age_score = state.property_age_risk_score
+    locality_score = state.locality_safety_score
+    overall = state.overall_risk_score
+    decision = state.decision
+    multiplier = state.premium_multiplier
 
     return {
         "risk_factors": [
@@ -36,25 +36,25 @@ def _fallback_explanation(state: AssessmentState) -> dict:
                 "name": "Flood Risk",
                 "score": flood_score,
                 "weight": 0.40,
-                "reasoning": state.get("flood_risk_reasoning", f"Flood Zone {state.get('flood_zone', 'unknown')}."),
+                "reasoning": state.flood_risk_reasoning or f"Flood Zone {state.flood_zone}.",
             },
             {
                 "name": "Property Age Risk",
                 "score": age_score,
                 "weight": 0.25,
-                "reasoning": state.get("property_profile_summary", f"Age band: {state.get('property_age_band', 'unknown')}."),
+                "reasoning": state.property_profile_summary or f"Age band: {state.property_age_band}.",
             },
             {
                 "name": "Planning & Development Risk",
                 "score": planning_score,
                 "weight": 0.20,
-                "reasoning": state.get("planning_risk_reasoning", f"Density: {state.get('planning_density_label', 'unknown')}."),
+                "reasoning": state.planning_risk_reasoning or f"Density: {state.planning_density_label}.",
             },
             {
                 "name": "Locality & Crime Risk",
                 "score": locality_score,
                 "weight": 0.15,
-                "reasoning": state.get("locality_safety_reasoning", f"Crime level: {state.get('locality_safety_label', 'unknown')}."),
+                "reasoning": state.locality_safety_reasoning or f"Crime level: {state.locality_safety_label}.",
             },
         ],
         "policy_citations": [],
@@ -68,34 +68,34 @@ def _fallback_explanation(state: AssessmentState) -> dict:
     }
 
 
-async def explainability_agent(state: AssessmentState) -> AssessmentState:
+async def explainability_agent(state: AssessmentState) -> dict:
     """ExplainabilityAgent: produce structured risk breakdown and plain-English narrative."""
     print(f"\n{'='*60}")
     print(f"[ExplainabilityAgent] Starting — generating customer-facing explanation")
-    print(f"  address        = {state.get('address', 'N/A')!r}")
-    print(f"  decision       = {state.get('decision', 'N/A')!r}")
-    print(f"  overall_score  = {state.get('overall_risk_score', 0)}")
-    print(f"  multiplier     = {state.get('premium_multiplier', 1.0):.2f}x")
-    print(f"  flood_score    = {state.get('flood_risk_score', 0)} (Zone {state.get('flood_zone', 'N/A')})")
-    print(f"  planning_score = {state.get('planning_risk_score', 0)}")
-    print(f"  age_score      = {state.get('property_age_risk_score', 0)}")
-    print(f"  locality_score = {state.get('locality_safety_score', 25.0)} ({state.get('locality_safety_label', 'N/A')})")
+    print(f"  address        = {state.address!r}")
+    print(f"  decision       = {state.decision!r}")
+    print(f"  overall_score  = {state.overall_risk_score}")
+    print(f"  multiplier     = {state.premium_multiplier:.2f}x")
+    print(f"  flood_score    = {state.flood_risk_score} (Zone {state.flood_zone})")
+    print(f"  planning_score = {state.planning_risk_score}")
+    print(f"  age_score      = {state.property_age_risk_score}")
+    print(f"  locality_score = {state.locality_safety_score} ({state.locality_safety_label})")
     print(f"{'='*60}")
 
-    policy_context_str = "\n".join(state.get("policy_context") or ["None"])
+    policy_context_str = "\n".join(state.policy_context or ["None"])
 
     user_prompt = f"""You are an AI assistant explaining an insurance underwriting decision to a customer.
 
 Assessment data:
-- Address: {state.get('address', 'N/A')}
-- Decision: {state.get('decision', 'N/A').upper()}
-- Overall Risk Score: {state.get('overall_risk_score', 0)}/100
-- Premium Multiplier: {state.get('premium_multiplier', 1.0):.2f}x
-- FloodRiskAgent score: {state.get('flood_risk_score', 0)}/100 (Zone {state.get('flood_zone', 'N/A')}) — {state.get('flood_risk_reasoning', '')}
-- PropertyValuationAgent score: {state.get('planning_risk_score', 0)}/100 ({state.get('planning_density_label', 'N/A')} planning density) — {state.get('planning_risk_reasoning', '')}
-- EnvironmentalDataAgent score: {state.get('property_age_risk_score', 0)}/100 ({state.get('property_age_band', 'N/A')}) — {state.get('property_profile_summary', '')}
-- LocalitySafetyAgent score: {state.get('locality_safety_score', 25.0)}/100 ({state.get('locality_safety_label', 'N/A')}) — {state.get('locality_safety_reasoning', '')}
-- CoordinatorAgent reasoning: {state.get('underwriter_reasoning', 'N/A')}
+- Address: {state.address}
+- Decision: {state.decision.upper()}
+- Overall Risk Score: {state.overall_risk_score}/100
+- Premium Multiplier: {state.premium_multiplier:.2f}x
+- FloodRiskAgent score: {state.flood_risk_score}/100 (Zone {state.flood_zone}) — {state.flood_risk_reasoning}
+- PropertyValuationAgent score: {state.planning_risk_score}/100 ({state.planning_density_label} planning density) — {state.planning_risk_reasoning}
+- EnvironmentalDataAgent score: {state.property_age_risk_score}/100 ({state.property_age_band}) — {state.property_profile_summary}
+- LocalitySafetyAgent score: {state.locality_safety_score}/100 ({state.locality_safety_label}) — {state.locality_safety_reasoning}
+- CoordinatorAgent reasoning: {state.underwriter_reasoning or 'N/A'}
 
 Policy guidelines used:
 {policy_context_str}
@@ -300,7 +300,7 @@ def _summarise_warnings(warnings: list[dict]) -> tuple[str, bool]:
 # ---------------------------------------------------------------------------
 # Main agent
 # ---------------------------------------------------------------------------
-async def flood_risk_agent(state: AssessmentState) -> AssessmentState:
+async def flood_risk_agent(state: AssessmentState) -> dict:
     """
     FloodRiskAgent — CYLTFR methodology.
 
@@ -309,8 +309,8 @@ async def flood_risk_agent(state: AssessmentState) -> AssessmentState:
       2. EA Flood Monitoring API — live flood warnings near property
     """
     errors: list[str] = []
-    lat = state.get("latitude")
-    lon = state.get("longitude")
+    lat = state.latitude
+    lon = state.longitude
 
     print("\n" + "=" * 60)
     print("[FloodRiskAgent] Starting — CYLTFR methodology")
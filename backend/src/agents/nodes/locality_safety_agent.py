@@ -175,11 +175,11 @@ def _score_crimes(crimes: list) -> tuple[float, dict[str, int]]:
     return score, category_counts
 
 
-async def locality_safety_agent(state: AssessmentState) -> AssessmentState:
+async def locality_safety_agent(state: AssessmentState) -> dict:
     """LocalitySafetyAgent: Police UK crime data → locality safety score."""
     errors: list[str] = []
-    lat = state.get("latitude")
-    lon = state.get("longitude")
+    lat = state.latitude
+    lon = state.longitude
 
     print("\n" + "="*60)
     print("[LocalitySafetyAgent] Starting")
@@ -13,12 +13,12 @@ from src.agents.state.assessment_state import AssessmentState
 from src.services.policy_service import retrieve_relevant_policies
 
 
-async def policy_agent(state: AssessmentState) -> AssessmentState:
+async def policy_agent(state: AssessmentState) -> dict:
     """PolicyAgent: semantic retrieval of relevant insurance policy guidelines."""
-    flood_zone = state.get("flood_zone", "unknown")
-    flood_score = state.get("flood_risk_score", 0)
-    planning_label = state.get("planning_density_label", "unknown")
-    age_band = state.get("property_age_band", "unknown")
+    flood_zone = state.flood_zone
+    flood_score = state.flood_risk_score
+    planning_label = state.planning_density_label
+    age_band = state.property_age_band
 
     print(f"\n{'='*60}")
     print(f"[PolicyAgent] Starting — RAG retrieval from MongoDB Atlas Vector Search")
@@ -15,172 +15,216 @@ Responsible for:
 IBEX API uses POST with JSON bodies. Coordinates are [longitude, latitude].
 """
 
+import asyncio
+import functools
+import heapq
 import json
+import logging
+import operator
+import re
+from dataclasses import dataclass, field
+
 import boto3
+import botocore.config
 import httpx
+import numpy as np
+import orjson
 from datetime import date, timedelta
+from src.agents.cache import AsyncTTLCache
 from src.agents.state.assessment_state import AssessmentState
 from src.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 POSTCODES_IO_URL = "https://api.postcodes.io/postcodes"
 IBEX_SEARCH_URL = f"{settings.IBEX_API_URL}/search"
 IBEX_STATS_URL = f"{settings.IBEX_API_URL}/stats"
 IBEX_APPS_BY_ID_URL = f"{settings.IBEX_API_URL}/applications-by-id"
 
-# Complete IBEX council_id lookup — keyed by lowercase council name.
-# Used to resolve council_id directly from postcodes.io admin_district name
-# without needing a wide-radius /search fallback.
-IBEX_COUNCIL_IDS: dict[str, int] = {
-    "bolton": 1, "bradford": 2, "bury": 3, "calderdale": 4, "doncaster": 5,
-    "gateshead": 6, "knowsley": 7, "north tyneside": 8, "oldham": 9, "rochdale": 10,
-    "salford": 11, "sandwell": 12, "sefton": 13, "solihull": 14, "st helens": 15,
-    "stockport": 16, "trafford": 17, "wakefield": 18, "wigan": 19, "wirral": 20,
-    "islington": 231, "ealing": 280, "barking and dagenham": 366,
-    "adur": 32, "adur and worthing": 32, "aylesbury vale": 33,
-    "babergh": 34, "babergh and mid-suffolk": 34, "basildon": 35,
-    "basingstoke and deane": 36, "bassetlaw": 37, "blaby": 38, "bolsover": 39,
-    "braintree": 40, "brentwood": 41, "brighton and hove": 153, "bristol": 154,
-    "bromley": 23, "bromsgrove": 113, "bromsgrove and redditch": 113,
-    "broxtowe": 467, "broxbourne": 445, "brent": 281, "burnley": 43,
-    "carlisle": 44, "castlepoint": 45, "chelmsford": 46, "cheltenham": 47,
-    "chesterfield": 48, "chichester": 49, "chorley": 51, "corby": 52,
-    "cotswold": 53, "craven": 54, "dacorum": 55, "dartford": 56,
-    "darlington": 158, "derby": 159, "derbyshire dales": 57, "dover": 58,
-    "durham": 157, "east cambridgeshire": 59, "east devon": 60,
-    "east hampshire": 61, "east hertfordshire": 62, "east lindsey": 63,
-    "east northamptonshire": 64, "east riding of yorkshire": 160,
-    "east suffolk": 65, "east renfrewshire": 284, "east staffordshire": 228,
-    "eastbourne": 468, "eastleigh": 469, "epsom and ewell": 67, "epsom ewell": 67,
-    "epping forest": 229, "erewash": 348, "exeter": 68,
-    "falkirk": 206, "fareham": 335, "fenland": 69, "fife": 207,
-    "folkestone and hythe": 70, "forest of dean": 71, "fylde": 72,
-    "gedling": 73, "gloucester city": 74, "gloucestershire": 291,
-    "gosport": 75, "gravesham": 76, "guildford": 77, "hackney": 230,
-    "hambleton": 78, "hammersmith and fulham": 275, "hammersmith & fulham": 275,
-    "harborough": 79, "haringey": 254, "harlow": 80, "harrogate": 81,
-    "harrow": 257, "hart": 82, "hartlepool": 255, "hastings": 83,
-    "havant": 84, "havering": 245, "hertsmere": 277,
-    "high peak": 270, "highland": 209, "hillingdon": 246,
-    "hinckley and bosworth": 85, "horsham": 86, "hounslow": 262,
-    "huntingdonshire": 87, "hyndburn": 696, "inverclyde": 210,
-    "ipswich": 380, "isle of anglesey": 454, "isle of wight": 161,
-    "isles of scilly": 700, "kettering": 411, "kings lynn and west norfolk": 293,
-    "kings lynn & west norfolk": 293, "kingston": 276, "kensington and chelsea": 261,
-    "kensington & chelsea": 261, "kirklees": 342, "lambeth": 26,
-    "lancaster": 89, "leeds": 294, "leeds city": 294,
-    "leicester city": 332, "lewes": 66, "lewisham": 27,
-    "lichfield": 91, "lincoln": 92, "liverpool city": 232, "luton": 162,
-    "maidstone": 132, "maidstone and swale": 132, "maldon": 94,
-    "malvern hills": 687, "manchester city": 295, "mansfield": 95,
-    "medway": 163, "melton": 96, "mendip": 97, "merton": 233,
-    "mid devon": 98, "mid ulster": 684, "middlesbrough": 164,
-    "midlothian": 211, "milton keynes": 165, "milton-keynes": 165,
-    "mole valley": 319, "moray": 415,
-    "newark and sherwood": 107, "newham": 28, "new forest": 106,
-    "newcastle upon tyne": 424, "newcastle-under-lyme": 108,
-    "newcastle upon tyne city": 424, "north ayrshire": 212,
-    "north devon": 340, "north east derbyshire": 101,
-    "north east lincolnshire": 166, "north hertfordshire": 102,
-    "north kesteven": 103, "north lanarkshire": 213,
-    "north lincolnshire": 455, "north norfolk": 104,
-    "north somerset": 167, "north tyneside": 8,
-    "north warwickshire": 271, "north west leicestershire": 105,
-    "north york moors": 241, "north yorkshire": 724,
-    "northumberland": 168, "norwich": 109,
-    "nottingham city": 169, "nuneaton and bedworth": 407,
-    "oadby and wigston": 110, "orkney islands": 214, "oxford": 111,
-    "pembrokeshire": 450, "pendle": 112, "perth and kinross": 215,
-    "peterborough": 170, "plymouth": 171, "poole": 299,
-    "portsmouth": 172, "preston": 457,
-    "reading": 328, "redbridge": 256, "redcar and cleveland": 458,
-    "reigate and banstead": 114, "renfrewshire": 216,
-    "ribble valley": 459, "richmond upon thames": 260, "richmondshire": 115,
-    "rochford": 431, "rossendale": 116, "rother": 247,
-    "rotherham": 327, "royal greenwich": 25, "rushcliffe": 117,
-    "rushmoor": 118, "rutland": 173, "ryedale": 119,
-    "salford": 11, "scarborough": 125, "scottish borders": 217,
-    "sedgemoor": 460, "selby": 126, "sevenoaks": 127,
-    "sheffield city": 302, "shetland islands": 218,
-    "shropshire": 174, "slough": 321, "south ayrshire": 219,
-    "south cambridgeshire": 287, "south derbyshire": 694,
-    "south gloucestershire": 177, "south hams": 341,
-    "south holland": 248, "south kesteven": 692,
-    "south lanarkshire": 220, "south norfolk": 121, "south norfolk and broadland": 121,
-    "south oxfordshire": 317, "south ribble": 122, "south somerset": 123,
-    "south staffordshire": 124, "south tyneside": 235,
-    "southampton": 175, "southend on sea": 176, "southend-on-sea": 176,
-    "southwark": 29, "spelthorne": 449, "st albans": 258, "st albans city": 258,
-    "stafford": 128, "staffordshire moorlands": 379,
-    "stevenage": 129, "stirling": 221, "stockton-on-tees": 178,
-    "stoke-on-trent": 179, "stratford-on-avon": 461, "stroud": 130,
-    "sunderland": 309, "surrey heath": 131, "sutton": 30,
-    "swansea": 188, "swindon": 180,
-    "tameside": 311, "tamworth": 236, "tandridge": 448,
-    "taunton": 666, "teignbridge": 344, "telford and wrekin": 470,
-    "telford & wrekin": 470, "tendring": 133, "test valley": 134,
-    "tewkesbury": 135, "thanet": 136, "three rivers": 278,
-    "thurrock": 181, "tonbridge and malling": 137, "torbay": 182,
-    "torridge": 138, "tower hamlets": 31, "tunbridge wells": 139,
-    "uttlesford": 140, "vale of glamorgan": 463,
-    "vale of white horse": 318, "walsall": 324, "waltham forest": 259,
-    "wandsworth": 237, "warrington": 320, "warwick": 141,
-    "watford": 279, "waverley": 336, "wealden": 432,
-    "wellingborough": 142, "welwyn hatfield": 331,
-    "west berkshire": 183, "west devon": 436,
-    "west dunbartonshire": 451, "west lancashire": 285,
-    "west lindsey": 452, "west lothian": 222,
-    "west northamptonshire": 697, "west oxfordshire": 143,
-    "west suffolk": 144, "westminster": 273,
-    "westmorland and furness": 326, "westmorland & furness": 326,
-    "winchester": 145, "windsor and maidenhead": 184,
-    "woking": 146, "wokingham": 325, "wolverhampton": 286,
-    "worcester city": 333, "wychavon": 434, "wyre": 149, "wyre forest": 464,
-    "york": 185, "yorkshire dales": 435,
-    # Scotland
-    "aberdeen city": 194, "aberdeenshire": 195, "angus": 196,
-    "argyll and bute": 197, "cairngorms national park": 693,
-    "clackmannanshire": 198, "dumfries and galloway": 199,
-    "dundee": 200, "east ayrshire": 201, "east dunbartonshire": 202,
-    "east lothian": 203, "edinburgh": 204, "glasgow": 208,
-    "na h-eileanan siar": 416, "north lanarkshire": 213,
-    "perth and kinross": 215, "loch lomond and the trossachs": 421,
-    # Wales
-    "blaenau gwent": 702, "brecon beacons national park": 413,
-    "bridgend": 428, "caerphilly": 186, "cardiff": 187,
-    "carmarthenshire": 462, "ceredigion": 423, "conwy": 238,
-    "denbighshire": 447, "flintshire": 440, "gwynedd": 422,
-    "merthyr tydfil": 189, "monmouthshire": 190,
-    "neath port talbot": 417, "newport": 337, "pembrokeshire coast national park": 691,
-    "powys": 191, "rhondda cynon taf": 192, "snowdonia national park": 430,
-    "torfaen": 193, "vale of glamorgan": 463, "wrexham": 439,
-    # National Parks & Special
-    "city of london": 414, "dartmoor national park": 686,
-    "ebbsfleet": 685, "exmoor national park": 441,
-    "lake district national park": 429, "london legacy development": 688,
-    "new forest national park": 689, "north yorkshire moors": 241,
-    "old oak and park royal": 690, "peak district": 699,
-    "south downs national park": 419, "the broads authority": 420,
-    # London Boroughs
-    "barking and dagenham": 366, "barnet": 272, "bexley": 22,
-    "camden": 240, "croydon": 274, "enfield": 24,
-    "hackney": 230, "haringey": 254, "harrow": 257,
-    "hounslow": 262, "lambeth": 26, "lewisham": 27,
-    "newham": 28, "redbridge": 256, "richmond upon thames": 260,
-    "southwark": 29, "tower hamlets": 31, "waltham forest": 259,
-    # Combined/Unitary
-    "barnsley": 427, "blackburn with darwen": 225,
-    "blackpool": 151, "bournemouth": 338,
-    "bournemouth christchurch and poole": 721, "bournemouth, christchurch, poole": 721,
-    "bracknell forest": 152, "buckinghamshire": 120, "chiltern and south bucks": 120,
-    "central and south bedfordshire": 456, "central & south bedfordshire": 456,
-    "cheshire east": 683, "cheshire west and chester": 155,
-    "copeland": 453, "cornwall": 156, "coventry city": 250,
-    "dudley": 322, "guernsey": 251, "halton": 695, "hull city": 292,
-    "north northamptonshire": 727,
-    "northern ireland": 223,
-    "somerset west and taunton": 303,
-}
+# Canonicalises council names so "&" vs "and" and hyphen vs space variants
+# all hash to the same key (e.g. "Telford & Wrekin" / "telford and wrekin").
+_NORM_TABLE = str.maketrans({"&": " and ", "-": " "})
+
+
+def _norm_council_name(name: str) -> str:
+    return " ".join(name.translate(_NORM_TABLE).lower().split())
+
+
+@functools.cache
+def _load_council_ids() -> dict[str, int]:
+    """Complete IBEX council_id lookup — keyed by normalised council name
+    (see _norm_council_name). Used to resolve council_id directly from
+    postcodes.io admin_district name without needing a wide-radius /search
+    fallback. Built lazily so importing the module (e.g. during app cold
+    start) does not pay for the ~370-entry literal until the agent runs.
+    """
+    return {
+        "bolton": 1, "bradford": 2, "bury": 3, "calderdale": 4, "doncaster": 5,
+        "gateshead": 6, "knowsley": 7, "north tyneside": 8, "oldham": 9, "rochdale": 10,
+        "salford": 11, "sandwell": 12, "sefton": 13, "solihull": 14, "st helens": 15,
+        "stockport": 16, "trafford": 17, "wakefield": 18, "wigan": 19, "wirral": 20,
+        "islington": 231, "ealing": 280, "barking and dagenham": 366,
+        "adur": 32, "adur and worthing": 32, "aylesbury vale": 33,
+        "babergh": 34, "babergh and mid suffolk": 34, "basildon": 35,
+        "basingstoke and deane": 36, "bassetlaw": 37, "blaby": 38, "bolsover": 39,
+        "braintree": 40, "brentwood": 41, "brighton and hove": 153, "bristol": 154,
+        "bromley": 23, "bromsgrove": 113, "bromsgrove and redditch": 113,
+        "broxtowe": 467, "broxbourne": 445, "brent": 281, "burnley": 43,
+        "carlisle": 44, "castlepoint": 45, "chelmsford": 46, "cheltenham": 47,
+        "chesterfield": 48, "chichester": 49, "chorley": 51, "corby": 52,
+        "cotswold": 53, "craven": 54, "dacorum": 55, "dartford": 56,
+        "darlington": 158, "derby": 159, "derbyshire dales": 57, "dover": 58,
+        "durham": 157, "east cambridgeshire": 59, "east devon": 60,
+        "east hampshire": 61, "east hertfordshire": 62, "east lindsey": 63,
+        "east northamptonshire": 64, "east riding of yorkshire": 160,
+        "east suffolk": 65, "east renfrewshire": 284, "east staffordshire": 228,
+        "eastbourne": 468, "eastleigh": 469, "epsom and ewell": 67, "epsom ewell": 67,
+        "epping forest": 229, "erewash": 348, "exeter": 68,
+        "falkirk": 206, "fareham": 335, "fenland": 69, "fife": 207,
+        "folkestone and hythe": 70, "forest of dean": 71, "fylde": 72,
+        "gedling": 73, "gloucester city": 74, "gloucestershire": 291,
+        "gosport": 75, "gravesham": 76, "guildford": 77, "hackney": 230,
+        "hambleton": 78, "hammersmith and fulham": 275,
+        "harborough": 79, "haringey": 254, "harlow": 80, "harrogate": 81,
+        "harrow": 257, "hart": 82, "hartlepool": 255, "hastings": 83,
+        "havant": 84, "havering": 245, "hertsmere": 277,
+        "high peak": 270, "highland": 209, "hillingdon": 246,
+        "hinckley and bosworth": 85, "horsham": 86, "hounslow": 262,
+        "huntingdonshire": 87, "hyndburn": 696, "inverclyde": 210,
+        "ipswich": 380, "isle of anglesey": 454, "isle of wight": 161,
+        "isles of scilly": 700, "kettering": 411, "kings lynn and west norfolk": 293,
+        "kingston": 276, "kensington and chelsea": 261,
+        "kirklees": 342, "lambeth": 26,
+        "lancaster": 89, "leeds": 294, "leeds city": 294,
+        "leicester city": 332, "lewes": 66, "lewisham": 27,
+        "lichfield": 91, "lincoln": 92, "liverpool city": 232, "luton": 162,
+        "maidstone": 132, "maidstone and swale": 132, "maldon": 94,
+        "malvern hills": 687, "manchester city": 295, "mansfield": 95,
+        "medway": 163, "melton": 96, "mendip": 97, "merton": 233,
+        "mid devon": 98, "mid ulster": 684, "middlesbrough": 164,
+        "midlothian": 211, "milton keynes": 165,
+        "mole valley": 319, "moray": 415,
+        "newark and sherwood": 107, "newham": 28, "new forest": 106,
+        "newcastle upon tyne": 424, "newcastle under lyme": 108,
+        "newcastle upon tyne city": 424, "north ayrshire": 212,
+        "north devon": 340, "north east derbyshire": 101,
+        "north east lincolnshire": 166, "north hertfordshire": 102,
+        "north kesteven": 103, "north lanarkshire": 213,
+        "north lincolnshire": 455, "north norfolk": 104,
+        "north somerset": 167, "north tyneside": 8,
+        "north warwickshire": 271, "north west leicestershire": 105,
+        "north york moors": 241, "north yorkshire": 724,
+        "northumberland": 168, "norwich": 109,
+        "nottingham city": 169, "nuneaton and bedworth": 407,
+        "oadby and wigston": 110, "orkney islands": 214, "oxford": 111,
+        "pembrokeshire": 450, "pendle": 112, "perth and kinross": 215,
+        "peterborough": 170, "plymouth": 171, "poole": 299,
+        "portsmouth": 172, "preston": 457,
+        "reading": 328, "redbridge": 256, "redcar and cleveland": 458,
+        "reigate and banstead": 114, "renfrewshire": 216,
+        "ribble valley": 459, "richmond upon thames": 260, "richmondshire": 115,
+        "rochford": 431, "rossendale": 116, "rother": 247,
+        "rotherham": 327, "royal greenwich": 25, "rushcliffe": 117,
+        "rushmoor": 118, "rutland": 173, "ryedale": 119,
+        "salford": 11, "scarborough": 125, "scottish borders": 217,
+        "sedgemoor": 460, "selby": 126, "sevenoaks": 127,
+        "sheffield city": 302, "shetland islands": 218,
+        "shropshire": 174, "slough": 321, "south ayrshire": 219,
+        "south cambridgeshire": 287, "south derbyshire": 694,
+        "south gloucestershire": 177, "south hams": 341,
+        "south holland": 248, "south kesteven": 692,
+        "south lanarkshire": 220, "south norfolk": 121, "south norfolk and broadland": 121,
+        "south oxfordshire": 317, "south ribble": 122, "south somerset": 123,
+        "south staffordshire": 124, "south tyneside": 235,
+        "southampton": 175, "southend on sea": 176,
+        "southwark": 29, "spelthorne": 449, "st albans": 258, "st albans city": 258,
+        "stafford": 128, "staffordshire moorlands": 379,
+        "stevenage": 129, "stirling": 221, "stockton on tees": 178,
+        "stoke on trent": 179, "stratford on avon": 461, "stroud": 130,
+        "sunderland": 309, "surrey heath": 131, "sutton": 30,
+        "swansea": 188, "swindon": 180,
+        "tameside": 311, "tamworth": 236, "tandridge": 448,
+        "taunton": 666, "teignbridge": 344, "telford and wrekin": 470,
+        "tendring": 133, "test valley": 134,
+        "tewkesbury": 135, "thanet": 136, "three rivers": 278,
+        "thurrock": 181, "tonbridge and malling": 137, "torbay": 182,
+        "torridge": 138, "tower hamlets": 31, "tunbridge wells": 139,
+        "uttlesford": 140, "vale of glamorgan": 463,
+        "vale of white horse": 318, "walsall": 324, "waltham forest": 259,
+        "wandsworth": 237, "warrington": 320, "warwick": 141,
+        "watford": 279, "waverley": 336, "wealden": 432,
+        "wellingborough": 142, "welwyn hatfield": 331,
+        "west berkshire": 183, "west devon": 436,
+        "west dunbartonshire": 451, "west lancashire": 285,
+        "west lindsey": 452, "west lothian": 222,
+        "west northamptonshire": 697, "west oxfordshire": 143,
+        "west suffolk": 144, "westminster": 273,
+        "westmorland and furness": 326,
+        "winchester": 145, "windsor and maidenhead": 184,
+        "woking": 146, "wokingham": 325, "wolverhampton": 286,
+        "worcester city": 333, "wychavon": 434, "wyre": 149, "wyre forest": 464,
+        "york": 185, "yorkshire dales": 435,
+        # Scotland
+        "aberdeen city": 194, "aberdeenshire": 195, "angus": 196,
+        "argyll and bute": 197, "cairngorms national park": 693,
+        "clackmannanshire": 198, "dumfries and galloway": 199,
+        "dundee": 200, "east ayrshire": 201, "east dunbartonshire": 202,
+        "east lothian": 203, "edinburgh": 204, "glasgow": 208,
+        "na h eileanan siar": 416, "north lanarkshire": 213,
+        "perth and kinross": 215, "loch lomond and the trossachs": 421,
+        # Wales
+        "blaenau gwent": 702, "brecon beacons national park": 413,
+        "bridgend": 428, "caerphilly": 186, "cardiff": 187,
+        "carmarthenshire": 462, "ceredigion": 423, "conwy": 238,
+        "denbighshire": 447, "flintshire": 440, "gwynedd": 422,
+        "merthyr tydfil": 189, "monmouthshire": 190,
+        "neath port talbot": 417, "newport": 337, "pembrokeshire coast national park": 691,
+        "powys": 191, "rhondda cynon taf": 192, "snowdonia national park": 430,
+        "torfaen": 193, "vale of glamorgan": 463, "wrexham": 439,
+        # National Parks & Special
+        "city of london": 414, "dartmoor national park": 686,
+        "ebbsfleet": 685, "exmoor national park": 441,
+        "lake district national park": 429, "london legacy development": 688,
+        "new forest national park": 689, "north yorkshire moors": 241,
+        "old oak and park royal": 690, "peak district": 699,
+        "south downs national park": 419, "the broads authority": 420,
+        # London Boroughs
+        "barking and dagenham": 366, "barnet": 272, "bexley": 22,
+        "camden": 240, "croydon": 274, "enfield": 24,
+        "hackney": 230, "haringey": 254, "harrow": 257,
+        "hounslow": 262, "lambeth": 26, "lewisham": 27,
+        "newham": 28, "redbridge": 256, "richmond upon thames": 260,
+        "southwark": 29, "tower hamlets": 31, "waltham forest": 259,
+        # Combined/Unitary
+        "barnsley": 427, "blackburn with darwen": 225,
+        "blackpool": 151, "bournemouth": 338,
+        "bournemouth christchurch and poole": 721, "bournemouth, christchurch, poole": 721,
+        "bracknell forest": 152, "buckinghamshire": 120, "chiltern and south bucks": 120,
+        "central and south bedfordshire": 456,
+        "cheshire east": 683, "cheshire west and chester": 155,
+        "copeland": 453, "cornwall": 156, "coventry city": 250,
+        "dudley": 322, "guernsey": 251, "halton": 695, "hull city": 292,
+        "north northamptonshire": 727,
+        "northern ireland": 223,
+        "somerset west and taunton": 303,
+    }
+
+
+def __getattr__(name: str):
+    # PEP 562 — keep IBEX_COUNCIL_IDS importable by name without building
+    # the table at import time.
+    if name == "IBEX_COUNCIL_IDS":
+        return _load_council_ids()
+    raise AttributeError(name)
+
+
+# High-risk keywords scanned for in application headings/proposals. Compiled
+# case-insensitive so the scan needs no per-row .lower() allocation.
+_RISK_RE = re.compile(
+    r"demolition|demolish|hazardous|contaminated|basement excavation|flood risk",
+    re.IGNORECASE,
+)
 
 _ACTIVITY_LEVEL_SCORES: dict[str, float] = {
     "low": 5.0,
@@ -193,34 +237,163 @@ _ACTIVITY_LEVEL_SCORES: dict[str, float] = {
 _DATE_TO = date.today().isoformat()
 _DATE_FROM = (date.today() - timedelta(days=730)).isoformat()
 
-_IBEX_HEADERS = {
+# Default headers for the shared HTTP client — set once on the client so
+# httpx does not re-merge a per-request header dict on every POST.
+_CLIENT_HEADERS = {
     "Authorization": f"Bearer {settings.IBEX_API_KEY}",
     "Content-Type": "application/json",
+    "User-Agent": "Aurea-Underwriting/1.0",
 }
 
+# Shared connection pool for all agent runs. A per-invocation AsyncClient
+# tears down the TCP+TLS pool every assessment; keeping one HTTP/2 client
+# alive lets concurrent runs multiplex IBEX calls over warm connections.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            headers=_CLIENT_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared client — called from the FastAPI lifespan shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@dataclass(slots=True)
+class SearchData:
+    """IBEX /search payload plus column views over the applications list.
+
+    ``raw`` keeps the untouched payload (for state storage and LLM prompt
+    construction); the NumPy columns serve the hot aggregations — keyword
+    scans, appeal counts, new-home thresholds — without re-walking a list
+    of dicts field by field.
+    """
+    raw: dict = field(default_factory=dict)
+    applications: list[dict] = field(default_factory=list)
+    headings: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    has_appeal: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    num_new_houses: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+
+
+def _search_data(raw) -> SearchData:
+    """Normalise an IBEX /search response (bare list or dict) into SearchData."""
+    if isinstance(raw, list):
+        applications = raw
+        raw = {"applications": applications}
+    elif isinstance(raw, dict):
+        apps = raw.get("applications", raw.get("results", []))
+        applications = apps if isinstance(apps, list) else []
+    else:
+        return SearchData()
+    n = len(applications)
+    return SearchData(
+        raw=raw,
+        applications=applications,
+        headings=np.array(
+            [a.get("heading") or a.get("proposal") or "" for a in applications],
+            dtype=object,
+        ),
+        has_appeal=np.fromiter(
+            (bool(a.get("appeal_status") or a.get("appeal_decision")) for a in applications),
+            dtype=bool, count=n,
+        ),
+        num_new_houses=np.fromiter(
+            (int(a.get("num_new_houses") or 0) for a in applications),
+            dtype=np.int32, count=n,
+        ),
+    )
+
+
+# Nominatim's usage policy is ~1 request/second per IP; a process-wide gate
+# spaces requests out so concurrent assessments queue politely instead of
+# tripping the block. Results are memoised for 30 days — postcodes don't move.
+_GEO_CACHE = AsyncTTLCache(maxsize=2048, ttl=30 * 86400.0)
+_geo_gate_lock = asyncio.Lock()
+_geo_next_slot = 0.0
+
+
+async def _nominatim_rate_gate() -> None:
+    global _geo_next_slot
+    async with _geo_gate_lock:
+        now = asyncio.get_running_loop().time()
+        wait = _geo_next_slot - now
+        _geo_next_slot = max(now, _geo_next_slot) + 1.0
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+async def _geocode_postcodes_io(client: httpx.AsyncClient, postcode: str):
+    """Fallback geocode via postcodes.io (free, no rate policy concerns)."""
+    try:
+        resp = await client.get(
+            f"{POSTCODES_IO_URL}/{postcode.replace(' ', '').upper()}",
+            timeout=8.0,
+        )
+        if resp.status_code == 200:
+            result = orjson.loads(resp.content).get("result") or {}
+            lat, lon = result.get("latitude"), result.get("longitude")
+            if lat is not None and lon is not None:
+                logger.debug("postcodes.io fallback geocode: lat=%s lon=%s", lat, lon)
+                return float(lat), float(lon)
+    except Exception as e:
+        logger.warning("postcodes.io fallback geocode failed: %s", e)
+    return None, None
+
 
 async def _geocode(client: httpx.AsyncClient, address: str, postcode: str = ""):
-    # Try full address first
-    for query in [address, f"{address}, UK", postcode, f"{postcode}, UK"]:
-        if not query or not query.strip():
-            continue
+    key = (postcode.strip().upper(), address.strip().lower())
+    async with _GEO_CACHE.lock(key):
+        cached = _GEO_CACHE.get(key)
+        if cached is not None:
+            return cached
+        lat, lon = await _geocode_nominatim(client, address, postcode)
+        if lat is None and postcode.strip():
+            # Nominatim came up empty or rate-limited — postcode centroid is
+            # good enough for the 500 m planning radius.
+            lat, lon = await _geocode_postcodes_io(client, postcode)
+        if lat is not None:
+            _GEO_CACHE.put(key, (lat, lon))
+        return lat, lon
+
+
+async def _geocode_nominatim(client: httpx.AsyncClient, address: str, postcode: str = ""):
+    # Try full address first, then postcode. The ", UK" variants are redundant
+    # because countrycodes=gb already constrains the search server-side, and
+    # Nominatim rate-limits to ~1 req/s so every extra query costs real time.
+    # dict.fromkeys dedupes while preserving order (address may equal postcode).
+    candidates = dict.fromkeys(
+        q.strip().removesuffix(", UK").strip() for q in (address, postcode) if q and q.strip()
+    )
+    for query in candidates:
+        await _nominatim_rate_gate()
         resp = await client.get(
             NOMINATIM_URL,
             params={"q": query.strip(), "format": "json", "limit": 1, "countrycodes": "gb"},
-            headers={"User-Agent": "Aurea-Underwriting/1.0"},
         )
-        print(f"[PropertyValuationAgent] Nominatim query={query!r} HTTP {resp.status_code} — {len(resp.content)} bytes")
-        data = resp.json()
-        print(f"[PropertyValuationAgent] Nominatim raw response: {str(data)[:400]}")
+        logger.debug("Nominatim query=%r HTTP %s — %s bytes", query, resp.status_code, len(resp.content))
+        data = orjson.loads(resp.content)
+        logger.debug("Nominatim raw response: %s", str(data)[:400])
         if data:
             hit = data[0]
-            print(f"[PropertyValuationAgent] Nominatim matched: {hit.get('display_name', '')[:120]}")
+            logger.debug("Nominatim matched: %s", hit.get('display_name', '')[:120])
             return float(hit["lat"]), float(hit["lon"])
-        print(f"[PropertyValuationAgent] Nominatim: no results for {query!r}")
+        logger.debug("Nominatim: no results for %r", query)
     return None, None
 
 
-async def _fetch_ibex_search(client: httpx.AsyncClient, lat: float, lon: float) -> dict:
+async def _fetch_ibex_search(client: httpx.AsyncClient, lat: float, lon: float) -> SearchData:
     """POST /search — nearby planning applications within 500 m."""
     body = {
         "input": {
@@ -239,100 +412,92 @@ async def _fetch_ibex_search(client: httpx.AsyncClient, lat: float, lon: float)
             "num_comments_received": True,
         },
     }
-    print(f"[PropertyValuationAgent] IBEX /search POST body: {body}")
+    logger.debug("IBEX /search POST body: %s", body)
     try:
         resp = await client.post(
             IBEX_SEARCH_URL,
             json=body,
-            headers=_IBEX_HEADERS,
             timeout=15.0,
         )
-        print(f"[PropertyValuationAgent] IBEX /search HTTP {resp.status_code} — {len(resp.content)} bytes")
+        logger.debug("IBEX /search HTTP %s — %s bytes", resp.status_code, len(resp.content))
         if resp.status_code != 200:
-            print(f"[PropertyValuationAgent] IBEX /search error: {resp.text[:400]}")
-            return {}
-        raw = resp.json()
-        print(f"[PropertyValuationAgent] IBEX /search RAW JSON:\n{json.dumps(raw, indent=2)}")
+            logger.warning("IBEX /search error: %s", resp.text[:400])
+            return SearchData()
+        raw = orjson.loads(resp.content)
+        logger.debug("IBEX /search RAW JSON:\n%s", orjson.dumps(raw, option=orjson.OPT_INDENT_2).decode())
         # API returns a bare list or a dict with an "applications" / "results" key
-        if isinstance(raw, list):
-            applications = raw
-            data = {"applications": applications}
-        else:
-            applications = raw.get("applications", raw.get("results", []))
-            data = raw
-        n = len(applications) if isinstance(applications, list) else 0
-        print(f"[PropertyValuationAgent] IBEX /search: {n} applications returned")
-        if isinstance(applications, list) and applications:
+        data = _search_data(raw)
+        applications = data.applications
+        n = len(applications)
+        logger.debug("IBEX /search: %s applications returned", n)
+        if applications:
             app = applications[0]
-            print(f"[PropertyValuationAgent]   --- Sample application (first of {n}) ---")
-            print(f"[PropertyValuationAgent]   council        : {app.get('council_name')}")
-            print(f"[PropertyValuationAgent]   reference      : {app.get('planning_reference')}")
-            print(f"[PropertyValuationAgent]   heading        : {app.get('heading')}")
-            print(f"[PropertyValuationAgent]   type           : {app.get('normalised_application_type')}")
-            print(f"[PropertyValuationAgent]   project_type   : {app.get('project_type')}")
-            print(f"[PropertyValuationAgent]   decision       : {app.get('normalised_decision')}")
-            print(f"[PropertyValuationAgent]   decided_date   : {app.get('decided_date')}")
-            print(f"[PropertyValuationAgent]   new_houses     : {app.get('num_new_houses')}")
-            print(f"[PropertyValuationAgent]   floor_area     : {app.get('proposed_floor_area')}")
-            print(f"[PropertyValuationAgent]   appeal_status  : {app.get('appeal_status')}")
-            print(f"[PropertyValuationAgent]   num_comments   : {app.get('num_comments_received')}")
-            print(f"[PropertyValuationAgent]   proposal       : {str(app.get('proposal', ''))[:120]}")
+            logger.debug("--- Sample application (first of %s) ---", n)
+            logger.debug("council        : %s", app.get('council_name'))
+            logger.debug("reference      : %s", app.get('planning_reference'))
+            logger.debug("heading        : %s", app.get('heading'))
+            logger.debug("type           : %s", app.get('normalised_application_type'))
+            logger.debug("project_type   : %s", app.get('project_type'))
+            logger.debug("decision       : %s", app.get('normalised_decision'))
+            logger.debug("decided_date   : %s", app.get('decided_date'))
+            logger.debug("new_houses     : %s", app.get('num_new_houses'))
+            logger.debug("floor_area     : %s", app.get('proposed_floor_area'))
+            logger.debug("appeal_status  : %s", app.get('appeal_status'))
+            logger.debug("num_comments   : %s", app.get('num_comments_received'))
+            logger.debug("proposal       : %s", str(app.get('proposal', ''))[:120])
 
             # Flag high-risk keywords in headings across all applications
-            risk_keywords = ["demolition", "demolish", "hazardous", "contaminated", "basement excavation", "flood risk"]
             flagged = [
                 f"{a.get('heading','')[:60]} ({a.get('normalised_decision')})"
                 for a in applications
-                if any(kw in (a.get("heading") or a.get("proposal") or "").lower() for kw in risk_keywords)
+                if _RISK_RE.search(a.get("heading") or a.get("proposal") or "")
             ]
             if flagged:
-                print(f"[PropertyValuationAgent]   ⚠ Risk keyword matches ({len(flagged)}):")
+                logger.debug("⚠ Risk keyword matches (%s):", len(flagged))
                 for f in flagged[:5]:
-                    print(f"[PropertyValuationAgent]     - {f}")
+                    logger.debug("- %s", f)
             else:
-                print(f"[PropertyValuationAgent]   No risk keyword matches in headings")
+                logger.debug("No risk keyword matches in headings")
         return data
     except Exception as e:
-        print(f"[PropertyValuationAgent] IBEX /search exception: {e}")
-        return {}
+        logger.warning("IBEX /search exception: %s", e)
+        return SearchData()
 
 
-async def _resolve_council_id(client: httpx.AsyncClient, postcode: str, search_data: dict) -> int | None:
+async def _resolve_council_id(client: httpx.AsyncClient, postcode: str, search_data: SearchData) -> int | None:
     """
     Resolve IBEX council_id using two strategies:
       1. Extract from /search results (fastest — already fetched)
       2. postcodes.io → admin_district_code then wide-radius /search to pick up council_id
     """
     # Strategy 1: council_id already present in search results
-    applications = search_data.get("applications", search_data.get("results", []))
-    if isinstance(applications, list):
-        for app in applications:
-            cid = app.get("council_id")
-            if cid:
-                print(f"[PropertyValuationAgent] council_id={cid} ({app.get('council_name', '?')}) from /search results")
-                return int(cid)
+    for app in search_data.applications:
+        cid = app.get("council_id")
+        if cid:
+            logger.debug("council_id=%s (%s) from /search results", cid, app.get('council_name', '?'))
+            return int(cid)
 
     # Strategy 2: postcodes.io → name lookup in IBEX_COUNCIL_IDS map
     postcode_clean = postcode.replace(" ", "").upper()
-    print(f"[PropertyValuationAgent] No council_id in search results — querying postcodes.io for {postcode_clean!r}")
+    logger.debug("No council_id in search results — querying postcodes.io for %r", postcode_clean)
     try:
         resp = await client.get(
             f"{POSTCODES_IO_URL}/{postcode_clean}",
             timeout=8.0,
         )
-        print(f"[PropertyValuationAgent] postcodes.io HTTP {resp.status_code} — {len(resp.content)} bytes")
+        logger.debug("postcodes.io HTTP %s — %s bytes", resp.status_code, len(resp.content))
         if resp.status_code == 200:
-            data = resp.json().get("result", {})
+            data = orjson.loads(resp.content).get("result", {})
             admin_code = data.get("codes", {}).get("admin_district", "")
             admin_name = data.get("admin_district", "")
             lat = data.get("latitude")
             lon = data.get("longitude")
-            print(f"[PropertyValuationAgent] postcodes.io: admin_district={admin_name!r} code={admin_code!r} lat={lat} lon={lon}")
+            logger.debug("postcodes.io: admin_district=%r code=%r lat=%s lon=%s", admin_name, admin_code, lat, lon)
 
             # Try direct name lookup first (fast, no extra API call)
-            cid = IBEX_COUNCIL_IDS.get(admin_name.lower().strip())
+            cid = _load_council_ids().get(_norm_council_name(admin_name))
             if cid:
-                print(f"[PropertyValuationAgent] council_id={cid} ({admin_name}) resolved from name lookup map")
+                logger.debug("council_id=%s (%s) resolved from name lookup map", cid, admin_name)
                 return cid
 
             # Use postcodes.io lat/lon to do a wide-radius search to find council_id
@@ -347,16 +512,15 @@ async def _resolve_council_id(client: httpx.AsyncClient, postcode: str, search_d
                     },
                     "extensions": {},
                 }
-                print(f"[PropertyValuationAgent] IBEX wide-radius search (2000m) for council_id")
+                logger.debug("IBEX wide-radius search (2000m) for council_id")
                 wide_resp = await client.post(
                     IBEX_SEARCH_URL,
                     json=wide_body,
-                    headers=_IBEX_HEADERS,
                     timeout=15.0,
                 )
-                print(f"[PropertyValuationAgent] IBEX wide search HTTP {wide_resp.status_code} — {len(wide_resp.content)} bytes")
+                logger.debug("IBEX wide search HTTP %s — %s bytes", wide_resp.status_code, len(wide_resp.content))
                 if wide_resp.status_code == 200 and wide_resp.content:
-                    wide_raw = wide_resp.json()
+                    wide_raw = orjson.loads(wide_resp.content)
                     if isinstance(wide_raw, list):
                         wide_apps = wide_raw
                     else:
@@ -365,16 +529,51 @@ async def _resolve_council_id(client: httpx.AsyncClient, postcode: str, search_d
                         for app in wide_apps:
                             cid = app.get("council_id")
                             if cid:
-                                print(f"[PropertyValuationAgent] council_id={cid} ({app.get('council_name', '?')}) from wide search")
+                                logger.debug("council_id=%s (%s) from wide search", cid, app.get('council_name', '?'))
                                 return int(cid)
     except Exception as e:
-        print(f"[PropertyValuationAgent] council_id resolution error: {e}")
+        logger.warning("council_id resolution error: %s", e)
 
-    print(f"[PropertyValuationAgent] Could not resolve council_id — /stats will be skipped")
+    logger.warning("Could not resolve council_id — /stats will be skipped")
     return None
 
 
-async def _fetch_ibex_stats(client: httpx.AsyncClient, council_id: int) -> dict:
+@dataclass(slots=True)
+class StatsView:
+    """IBEX /stats payload normalised once into typed fields.
+
+    ``raw`` keeps the untouched payload for state storage; scoring reads
+    the attributes directly instead of repeating .get + isinstance + or-0
+    chains per assessment.
+    """
+    raw: dict = field(default_factory=dict)
+    activity_level: str = ""
+    new_homes: int = 0
+    approval_rate: float = 0.0
+    refusal_rate: float = 0.0
+    app_counts: dict = field(default_factory=dict)
+    total_apps: int = 0
+
+
+def _stats_view(data) -> StatsView:
+    """Normalise a /stats response dict into a StatsView."""
+    if not isinstance(data, dict):
+        return StatsView()
+    app_counts = data.get("number_of_applications", {})
+    if not isinstance(app_counts, dict):
+        app_counts = {}
+    return StatsView(
+        raw=data,
+        activity_level=str(data.get("council_development_activity_level", "")).lower(),
+        new_homes=int(data.get("number_of_new_homes_approved", 0) or 0),
+        approval_rate=float(data.get("approval_rate", 0) or 0),
+        refusal_rate=float(data.get("refusal_rate", 0) or 0),
+        app_counts=app_counts,
+        total_apps=sum(app_counts.values()),
+    )
+
+
+async def _fetch_ibex_stats(client: httpx.AsyncClient, council_id: int) -> StatsView:
     """POST /stats — council-level statistics for the given council_id."""
     body = {
         "input": {
@@ -383,53 +582,53 @@ async def _fetch_ibex_stats(client: httpx.AsyncClient, council_id: int) -> dict:
             "date_to": _DATE_TO,
         }
     }
-    print(f"[PropertyValuationAgent] IBEX /stats POST body: {body}")
+    logger.debug("IBEX /stats POST body: %s", body)
     try:
         resp = await client.post(
             IBEX_STATS_URL,
             json=body,
-            headers=_IBEX_HEADERS,
             timeout=15.0,
         )
-        print(f"[PropertyValuationAgent] IBEX /stats HTTP {resp.status_code} — {len(resp.content)} bytes")
+        logger.debug("IBEX /stats HTTP %s — %s bytes", resp.status_code, len(resp.content))
         if resp.status_code != 200:
-            print(f"[PropertyValuationAgent] IBEX /stats error: {resp.text[:400]}")
-            return {}
-        data = resp.json()
-        print(f"[PropertyValuationAgent] IBEX /stats RAW JSON:\n{json.dumps(data, indent=2)}")
-        _ar = data.get('approval_rate', 0) or 0
-        _rr = data.get('refusal_rate', 0) or 0
-        print(f"[PropertyValuationAgent] IBEX /stats response:")
-        print(f"[PropertyValuationAgent]   activity_level   : {data.get('council_development_activity_level')}")
-        print(f"[PropertyValuationAgent]   approval_rate    : {_ar * 100:.1f}%")
-        print(f"[PropertyValuationAgent]   refusal_rate     : {_rr * 100:.1f}%")
-        print(f"[PropertyValuationAgent]   new_homes        : {data.get('number_of_new_homes_approved')}")
-        app_counts = data.get('number_of_applications', {})
-        total = sum(app_counts.values()) if isinstance(app_counts, dict) else 0
-        print(f"[PropertyValuationAgent]   total_apps       : {total}")
-        if isinstance(app_counts, dict):
-            top = sorted(app_counts.items(), key=lambda x: x[1], reverse=True)[:4]
-            print(f"[PropertyValuationAgent]   top_app_types    : {', '.join(f'{k}({v})' for k,v in top)}")
+            logger.warning("IBEX /stats error: %s", resp.text[:400])
+            return StatsView()
+        data = orjson.loads(resp.content)
+        logger.debug("IBEX /stats RAW JSON:\n%s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        view = _stats_view(data)
+        logger.debug("IBEX /stats response:")
+        logger.debug("activity_level   : %s", view.activity_level)
+        logger.debug("approval_rate    : %.1f%%", view.approval_rate * 100)
+        logger.debug("refusal_rate     : %.1f%%", view.refusal_rate * 100)
+        logger.debug("new_homes        : %s", view.new_homes)
+        logger.debug("total_apps       : %s", view.total_apps)
+        if view.app_counts and logger.isEnabledFor(logging.DEBUG):
+            # nlargest is O(n log 4) vs a full O(n log n) sort just to log 4 types
+            top = heapq.nlargest(4, view.app_counts.items(), key=operator.itemgetter(1))
+            logger.debug("top_app_types: %s", ', '.join(f'{k}({v})' for k, v in top))
         avg_times = data.get('average_decision_time', {})
         if isinstance(avg_times, dict):
-            print(f"[PropertyValuationAgent]   avg_decision_days: {', '.join(f'{k}={round(v)}d' for k,v in list(avg_times.items())[:3])}")
-        return data
+            logger.debug("avg_decision_days: %s", ', '.join(f'{k}={round(v)}d' for k,v in list(avg_times.items())[:3]))
+        return view
     except Exception as e:
-        print(f"[PropertyValuationAgent] IBEX /stats exception: {e}")
-        return {}
+        logger.warning("IBEX /stats exception: %s", e)
+        return StatsView()
 
 
-async def _fetch_ibex_applications_by_id(
+# /applications-by-id batching: 50 ids per POST, at most 4 requests in flight
+# so a burst of flagged applications doesn't trip IBEX rate limits.
+_APPS_BY_ID_BATCH_SIZE = 50
+_APPS_BY_ID_MAX_CONCURRENCY = 4
+
+
+async def _post_apps_by_id_batch(
     client: httpx.AsyncClient,
-    applications: list[tuple[int, str]],  # [(council_id, planning_reference), ...]
+    batch: list[tuple[int, str]],
+    semaphore: asyncio.Semaphore,
 ) -> list[dict]:
-    """POST /applications-by-id — fetch full details for specific applications.
-    Body format: {"applications": [[council_id, ref], ...], "extensions": {...}}
-    """
-    if not applications:
-        return []
+    """POST one /applications-by-id batch; returns [] on any failure."""
     body = {
-        "applications": [[cid, ref] for cid, ref in applications],
+        "applications": [[cid, ref] for cid, ref in batch],
         "extensions": {
             "documents": True,
             "appeals": True,
@@ -437,33 +636,235 @@ async def _fetch_ibex_applications_by_id(
             "heading": True,
         },
     }
-    print(f"[PropertyValuationAgent] IBEX /applications-by-id POST — {len(applications)} app(s): {applications}")
     try:
-        resp = await client.post(
-            IBEX_APPS_BY_ID_URL,
-            json=body,
-            headers=_IBEX_HEADERS,
-            timeout=15.0,
-        )
-        print(f"[PropertyValuationAgent] IBEX /applications-by-id HTTP {resp.status_code} — {len(resp.content)} bytes")
+        async with semaphore:
+            resp = await client.post(
+                IBEX_APPS_BY_ID_URL,
+                json=body,
+                timeout=15.0,
+            )
+        logger.debug("IBEX /applications-by-id HTTP %s — %s bytes", resp.status_code, len(resp.content))
         if resp.status_code != 200:
-            print(f"[PropertyValuationAgent] IBEX /applications-by-id error: {resp.text[:400]}")
+            logger.warning("IBEX /applications-by-id error: %s", resp.text[:400])
             return []
-        data = resp.json()
-        print(f"[PropertyValuationAgent] IBEX /applications-by-id RAW JSON:\n{json.dumps(data, indent=2)}")
-        results = data if isinstance(data, list) else data.get("applications", [])
-        print(f"[PropertyValuationAgent] /applications-by-id: {len(results)} result(s)")
-        for r in results:
-            docs = r.get("documents") or []
-            print(f"[PropertyValuationAgent]   ref={r.get('planning_reference')} heading={r.get('heading')} "
-                  f"decision={r.get('normalised_decision')} docs={len(docs)}")
-        return results
+        data = orjson.loads(resp.content)
+        logger.debug("IBEX /applications-by-id RAW JSON:\n%s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        return data if isinstance(data, list) else data.get("applications", [])
     except Exception as e:
-        print(f"[PropertyValuationAgent] IBEX /applications-by-id exception: {e}")
+        logger.warning("IBEX /applications-by-id exception: %s", e)
         return []
 
 
-def _analyse_construction_risk_with_llm(applications: list[dict]) -> dict:
+async def _fetch_ibex_applications_by_id(
+    client: httpx.AsyncClient,
+    applications: list[tuple[int, str]],  # [(council_id, planning_reference), ...]
+) -> list[dict]:
+    """POST /applications-by-id — fetch full details for specific applications.
+    Body format: {"applications": [[council_id, ref], ...], "extensions": {...}}
+
+    Large inputs are split into fixed-size batches issued concurrently, with
+    results flattened back in input order.
+    """
+    if not applications:
+        return []
+    batches = [
+        applications[i:i + _APPS_BY_ID_BATCH_SIZE]
+        for i in range(0, len(applications), _APPS_BY_ID_BATCH_SIZE)
+    ]
+    logger.debug("IBEX /applications-by-id POST — %s app(s) in %s batch(es): %s", len(applications), len(batches), applications)
+    semaphore = asyncio.Semaphore(_APPS_BY_ID_MAX_CONCURRENCY)
+    batch_results = await asyncio.gather(
+        *(_post_apps_by_id_batch(client, batch, semaphore) for batch in batches)
+    )
+    results = [r for batch in batch_results for r in batch]
+    logger.debug("/applications-by-id: %s result(s)", len(results))
+    for r in results:
+        docs = r.get("documents") or []
+        logger.debug("ref=%s heading=%s decision=%s docs=%s", r.get('planning_reference'), r.get('heading'), r.get('normalised_decision'), len(docs))
+    return results
+
+
+# Constant parts of the construction-risk prompt, built once at import so the
+# per-call work is a single join of head + headings + tail.
+_CONSTRUCTION_SYSTEM = "You are an insurance underwriting specialist. Respond only with valid JSON."
+
+_CONSTRUCTION_PROMPT_HEAD = """You are an expert insurance underwriter analysing nearby planning applications for a UK residential property insurance assessment.
+
+Review the following planning application headings from within 500m of the subject property and identify activities that pose elevated risk to adjacent properties.
+
+Risk categories:
+- DEMOLITION: Full/partial demolition of structures (severity varies: shed=low, multi-storey=high)
+- EXCAVATION: Basement excavation, underground works, deep foundations, piling
+- HAZARDOUS: Asbestos removal, contaminated land remediation, hazardous material handling
+- LARGE_SCALE: Major developments (10+ units, large commercial, significant infrastructure)
+- CHANGE_OF_USE: Industrial/commercial to residential conversion (contamination risk)
+
+Applications (within 500m):
+"""
+
+_CONSTRUCTION_PROMPT_TAIL = """
+
+Return ONLY this JSON (no markdown, no explanation):
+{
+  "risk_instances": [
+    {"reference": "...", "heading": "...", "risk_type": "DEMOLITION|EXCAVATION|HAZARDOUS|LARGE_SCALE|CHANGE_OF_USE", "severity": "low|medium|high", "reasoning": "one sentence"}
+  ],
+  "risk_score": <integer 0-30>,
+  "summary": "one sentence summarising construction risk near this property"
+}
+
+Risk score guide: 0=no risk, 5=minor works only, 10=moderate construction, 20=major demolition/excavation, 30=hazardous/large-scale activity."""
+
+# Batched variant: several properties' headings in one prompt, one JSON
+# object back with a per-property results array.
+_CONSTRUCTION_BATCH_HEAD = _CONSTRUCTION_PROMPT_HEAD.rsplit("Applications", 1)[0] + (
+    "You are assessing several independent properties in one pass. "
+    "Analyse each property's applications separately.\n\n"
+)
+
+_CONSTRUCTION_BATCH_TAIL = """
+
+Return ONLY this JSON (no markdown, no explanation): {"results": [...]} where "results" has exactly <N> entries and entry i corresponds to Property i+1, each entry shaped as:
+{
+  "risk_instances": [
+    {"reference": "...", "heading": "...", "risk_type": "DEMOLITION|EXCAVATION|HAZARDOUS|LARGE_SCALE|CHANGE_OF_USE", "severity": "low|medium|high", "reasoning": "one sentence"}
+  ],
+  "risk_score": <integer 0-30>,
+  "summary": "one sentence summarising construction risk near this property"
+}
+
+Risk score guide: 0=no risk, 5=minor works only, 10=moderate construction, 20=major demolition/excavation, 30=hazardous/large-scale activity."""
+
+
+# Caps in-flight invoke_model calls so a burst of concurrent assessments
+# stays under the per-account Bedrock TPS quota instead of getting 429'd,
+# and bounds how many worker threads the to_thread offload can occupy.
+_BEDROCK_SEM = asyncio.Semaphore(8)
+
+
+@functools.cache
+def _bedrock_client():
+    """Shared Bedrock client — boto3.client() costs ~50ms of endpoint
+    discovery and credential-chain resolution, so build it exactly once."""
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=settings.AWS_REGION,
+        config=botocore.config.Config(
+            max_pool_connections=20,
+            retries={"max_attempts": 2, "mode": "standard"},
+        ),
+    )
+
+
+def _invoke_construction_sync(blocks: list[str]) -> list[dict]:
+    """Single blocking Bedrock round-trip for one or more heading blocks.
+    Returns one result dict per block; raises if the batch response does
+    not line up with the submitted tasks."""
+    if len(blocks) == 1:
+        prompt = "".join((_CONSTRUCTION_PROMPT_HEAD, blocks[0], _CONSTRUCTION_PROMPT_TAIL))
+    else:
+        tasks = "\n\n".join(
+            f"### Property {i + 1}\nApplications (within 500m):\n{block}"
+            for i, block in enumerate(blocks)
+        )
+        prompt = "".join((
+            _CONSTRUCTION_BATCH_HEAD,
+            tasks,
+            _CONSTRUCTION_BATCH_TAIL.replace("<N>", str(len(blocks))),
+        ))
+
+    response = _bedrock_client().invoke_model(
+        modelId=settings.BEDROCK_MODEL_ID,
+        body=json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 1024 * len(blocks),
+            "system": _CONSTRUCTION_SYSTEM,
+            "messages": [{"role": "user", "content": prompt}],
+        }),
+        contentType="application/json",
+        accept="application/json",
+    )
+    body = orjson.loads(response["body"].read())
+    text = body["content"][0]["text"].strip()
+    if "```" in text:
+        parts = text.split("```")
+        text = parts[1] if len(parts) > 1 else text
+        if text.startswith("json"):
+            text = text[4:]
+    result = json.loads(text.strip())
+    if len(blocks) == 1:
+        return [result]
+    results = result.get("results") if isinstance(result, dict) else result
+    if not isinstance(results, list) or len(results) != len(blocks):
+        raise ValueError(
+            f"Batch LLM response had {len(results) if isinstance(results, list) else 'no'} "
+            f"result(s) for {len(blocks)} task(s)"
+        )
+    return results
+
+
+class _BedrockBatcher:
+    """Coalesce concurrent construction-risk analyses into one Bedrock call.
+
+    Submissions arriving within `window_s` of each other (up to `max_batch`)
+    share a single InvokeModel round-trip whose response carries one result
+    per property, amortising the per-request overhead and token accounting
+    across assessments. The usual batching trade-off applies: the first
+    submitter waits out the window before the call is issued.
+    """
+
+    def __init__(self, window_s: float = 0.025, max_batch: int = 8):
+        self.window_s = window_s
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._drainer: asyncio.Task | None = None
+
+    async def submit(self, headings_block: str) -> dict:
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((headings_block, fut))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        return await fut
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            blocks: list[str] = []
+            futures: list[asyncio.Future] = []
+            deadline = loop.time() + self.window_s
+            while len(blocks) < self.max_batch:
+                try:
+                    if not blocks:
+                        block, fut = self._queue.get_nowait()
+                    else:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        block, fut = await asyncio.wait_for(self._queue.get(), timeout)
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                blocks.append(block)
+                futures.append(fut)
+            if not blocks:
+                return
+            logger.debug("Bedrock batch: %s construction analysis task(s)", len(blocks))
+            try:
+                async with _BEDROCK_SEM:
+                    results = await asyncio.to_thread(_invoke_construction_sync, blocks)
+            except Exception as e:
+                for fut in futures:
+                    if not fut.cancelled():
+                        fut.set_exception(e)
+            else:
+                for fut, result in zip(futures, results):
+                    if not fut.cancelled():
+                        fut.set_result(result)
+
+
+_construction_batcher = _BedrockBatcher()
+
+
+async def _analyse_construction_risk_with_llm(applications: list[dict]) -> dict:
     """
     Pass nearby planning application headings to Claude via Bedrock.
     Identifies demolition, excavation, hazardous materials, contamination,
@@ -491,80 +892,34 @@ def _analyse_construction_risk_with_llm(applications: list[dict]) -> dict:
     if not headings:
         return {"risk_score": 0, "risk_instances": [], "summary": "No headings available to analyse."}
 
-    prompt = f"""You are an expert insurance underwriter analysing nearby planning applications for a UK residential property insurance assessment.
-
-Review the following planning application headings from within 500m of the subject property and identify activities that pose elevated risk to adjacent properties.
-
-Risk categories:
-- DEMOLITION: Full/partial demolition of structures (severity varies: shed=low, multi-storey=high)
-- EXCAVATION: Basement excavation, underground works, deep foundations, piling
-- HAZARDOUS: Asbestos removal, contaminated land remediation, hazardous material handling
-- LARGE_SCALE: Major developments (10+ units, large commercial, significant infrastructure)
-- CHANGE_OF_USE: Industrial/commercial to residential conversion (contamination risk)
-
-Applications (within 500m):
-{chr(10).join(headings)}
-
-Return ONLY this JSON (no markdown, no explanation):
-{{
-  "risk_instances": [
-    {{"reference": "...", "heading": "...", "risk_type": "DEMOLITION|EXCAVATION|HAZARDOUS|LARGE_SCALE|CHANGE_OF_USE", "severity": "low|medium|high", "reasoning": "one sentence"}}
-  ],
-  "risk_score": <integer 0-30>,
-  "summary": "one sentence summarising construction risk near this property"
-}}
-
-Risk score guide: 0=no risk, 5=minor works only, 10=moderate construction, 20=major demolition/excavation, 30=hazardous/large-scale activity."""
-
     try:
-        client = boto3.client("bedrock-runtime", region_name=settings.AWS_REGION)
-        response = client.invoke_model(
-            modelId=settings.BEDROCK_MODEL_ID,
-            body=json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 1024,
-                "system": "You are an insurance underwriting specialist. Respond only with valid JSON.",
-                "messages": [{"role": "user", "content": prompt}],
-            }),
-            contentType="application/json",
-            accept="application/json",
-        )
-        body = json.loads(response["body"].read())
-        text = body["content"][0]["text"].strip()
-        if "```" in text:
-            parts = text.split("```")
-            text = parts[1] if len(parts) > 1 else text
-            if text.startswith("json"):
-                text = text[4:]
-        result = json.loads(text.strip())
-        print(f"[PropertyValuationAgent] LLM construction risk: score={result.get('risk_score')} instances={len(result.get('risk_instances', []))}")
-        print(f"[PropertyValuationAgent] LLM summary: {result.get('summary', '')}")
+        # The batcher coalesces concurrent analyses into one invoke_model
+        # call; the blocking round-trip itself runs on a worker thread so
+        # the event loop keeps progressing the other agents.
+        result = await _construction_batcher.submit("\n".join(headings))
+        logger.debug("LLM construction risk: score=%s instances=%s", result.get('risk_score'), len(result.get('risk_instances', [])))
+        logger.debug("LLM summary: %s", result.get('summary', ''))
         for inst in result.get("risk_instances", []):
-            print(f"[PropertyValuationAgent]   {inst.get('risk_type')} ({inst.get('severity')}) — {inst.get('heading', '')[:80]}")
+            logger.debug("%s (%s) — %s", inst.get('risk_type'), inst.get('severity'), inst.get('heading', '')[:80])
         return result
     except Exception as e:
-        print(f"[PropertyValuationAgent] LLM construction analysis failed: {e} — falling back to keyword scoring")
+        logger.warning("LLM construction analysis failed: %s — falling back to keyword scoring", e)
         return {"risk_score": 0, "risk_instances": [], "summary": f"LLM analysis unavailable: {e}"}
 
 
-def _score_planning(stats: dict, search: dict, llm_construction: dict | None = None) -> tuple[float, str, str]:
-    """Score planning risk 0-100 using stats (primary) + local search (supplement)."""
-    # --- Stats-based score ---
-    activity_level = str(stats.get("council_development_activity_level", "")).lower()
-    base_score = _ACTIVITY_LEVEL_SCORES.get(activity_level, 0.0)
+_DENSITY_LABELS = ("Low", "Moderate", "High", "Very High")
 
-    new_homes = int(stats.get("number_of_new_homes_approved", 0) or 0)
-    approval_rate = float(stats.get("approval_rate", 0) or 0)
-    refusal_rate = float(stats.get("refusal_rate", 0) or 0)
-    app_counts = stats.get("number_of_applications", {})
-    total_apps = sum(app_counts.values()) if isinstance(app_counts, dict) else 0
-
-    # API returns rates as decimals (0.0–1.0); convert to % for display
-    approval_pct = approval_rate * 100
-    refusal_pct = refusal_rate * 100
-    print(f"[PropertyValuationAgent] Stats: activity={activity_level!r} total_apps={total_apps} "
-          f"new_homes={new_homes} approval={approval_pct:.1f}% refusal={refusal_pct:.1f}%")
 
+def _score_kernel(
+    base_score: float,
+    new_homes: int,
+    refusal_rate: float,
+    construction_score: float,
+    appeals: int,
+) -> tuple[float, int]:
+    """Pure-numeric scoring kernel: returns (score, label index into
+    _DENSITY_LABELS). Kept free of I/O and string work so the arithmetic
+    is isolated from the formatting around it."""
     stats_bonus = 0.0
     if new_homes > 500:
         stats_bonus += 8.0
@@ -573,6 +928,40 @@ def _score_planning(stats: dict, search: dict, llm_construction: dict | None = N
     if refusal_rate > 0.20:
         stats_bonus += 4.0
 
+    appeal_bonus = min(appeals * 3, 12.0)
+
+    if base_score > 0:
+        score = min(base_score + stats_bonus + construction_score + appeal_bonus, 100.0)
+    else:
+        score = min(construction_score + appeal_bonus, 100.0)
+
+    label_idx = 0 if score < 25 else 1 if score < 50 else 2 if score < 75 else 3
+    return score, label_idx
+
+
+def _score_planning(
+    stats: StatsView,
+    search: SearchData,
+    llm_construction: dict | None = None,
+    appeals: int | None = None,
+) -> tuple[float, str, str]:
+    """Score planning risk 0-100 using stats (primary) + local search (supplement)."""
+    # --- Stats-based score ---
+    activity_level = stats.activity_level
+    base_score = _ACTIVITY_LEVEL_SCORES.get(activity_level, 0.0)
+
+    new_homes = stats.new_homes
+    refusal_rate = stats.refusal_rate
+    total_apps = stats.total_apps
+
+    # API returns rates as decimals (0.0–1.0); convert to % for display
+    approval_pct = stats.approval_rate * 100
+    refusal_pct = refusal_rate * 100
+    # __debug__ guard: under `python -O` these blocks are compiled away
+    # entirely, so scoring pays nothing for its diagnostics in prod.
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Stats: activity=%r total_apps=%s new_homes=%s approval=%.1f%% refusal=%.1f%%", activity_level, total_apps, new_homes, approval_pct, refusal_pct)
+
     # --- LLM construction risk (local radius) ---
     # Replaces keyword matching — Claude analyses headings in context and returns
     # a calibrated 0–30 score based on actual instances and their scale/severity.
@@ -582,143 +971,199 @@ def _score_planning(stats: dict, search: dict, llm_construction: dict | None = N
     risk_instances = construction.get("risk_instances", [])
 
     # Appeals still counted directly — LLM doesn't assess appeal risk
-    applications = search.get("applications", search.get("results", []))
-    local_count = len(applications) if isinstance(applications, list) else 0
-    appeals = sum(1 for a in (applications or []) if a.get("appeal_status") or a.get("appeal_decision"))
-    appeal_bonus = min(appeals * 3, 12.0)
+    local_count = len(search.applications)
+    if appeals is None:
+        appeals = int(search.has_appeal.sum())
 
-    print(f"[PropertyValuationAgent] Construction: llm_score={construction_score} appeals={appeals} appeal_bonus={appeal_bonus}")
-    print(f"[PropertyValuationAgent] Risk instances: {len(risk_instances)}")
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Construction: llm_score=%s appeals=%s", construction_score, appeals)
+        logger.debug("Risk instances: %s", len(risk_instances))
 
     # --- Combine ---
-    if base_score > 0:
-        score = min(base_score + stats_bonus + construction_score + appeal_bonus, 100.0)
-    else:
-        score = min(construction_score + appeal_bonus, 100.0)
+    score, label_idx = _score_kernel(base_score, new_homes, refusal_rate, construction_score, appeals)
+    label = _DENSITY_LABELS[label_idx]
 
-    if score < 25:
-        label = "Low"
-    elif score < 50:
-        label = "Moderate"
-    elif score < 75:
-        label = "High"
-    else:
-        label = "Very High"
-
-    reasoning = (
-        f"Council activity: {activity_level or 'unknown'}. "
-        f"{total_apps} council-level applications; {new_homes} new homes approved. "
-        f"Approval rate {approval_pct:.1f}%, refusal rate {refusal_pct:.1f}%. "
-        f"Local construction risk (LLM analysis of {local_count} applications within 500 m): {construction_summary} "
-        f"{len(risk_instances)} risk instance(s) identified. {appeals} appeal(s)."
-    )
+    # Assembled with str.join over pre-stringified parts: one allocation and
+    # one __format__ call per value instead of re-running the f-string
+    # formatting opcodes for every interpolation.
+    reasoning = "".join((
+        "Council activity: ", activity_level or "unknown", ". ",
+        str(total_apps), " council-level applications; ", str(new_homes), " new homes approved. ",
+        "Approval rate ", format(approval_pct, ".1f"), "%, refusal rate ", format(refusal_pct, ".1f"), "%. ",
+        "Local construction risk (LLM analysis of ", str(local_count), " applications within 500 m): ",
+        construction_summary, " ",
+        str(len(risk_instances)), " risk instance(s) identified. ", str(appeals), " appeal(s).",
+    ))
     return float(round(score, 1)), label, reasoning
 
 
-async def property_valuation_agent(state: AssessmentState) -> AssessmentState:
+# Only the fields the assessment ever reads again are persisted in
+# raw_planning_data — the full IBEX /search payload can run to hundreds of
+# KB per property, bloating every Mongo document and history response.
+_WANTED_APP_FIELDS = frozenset({
+    "council_id", "planning_reference", "heading", "proposal",
+    "appeal_status", "appeal_decision", "num_new_houses",
+    "normalised_decision", "latitude", "longitude",
+})
+_WANTED_STATS_FIELDS = frozenset({
+    "council_development_activity_level", "number_of_new_homes_approved",
+    "approval_rate", "refusal_rate", "number_of_applications",
+})
+
+
+def _prune_planning_payloads(stats: StatsView, search: SearchData) -> tuple[dict, dict]:
+    """Project the raw IBEX payloads down to the fields scoring consumes."""
+    stored_stats = {k: stats.raw[k] for k in _WANTED_STATS_FIELDS if k in stats.raw}
+    stored_search = {
+        "applications": [
+            {k: a[k] for k in _WANTED_APP_FIELDS if k in a}
+            for a in search.applications
+        ],
+    }
+    return stored_stats, stored_search
+
+
+# Re-assessing the same property is common (demos, retries, history re-runs);
+# a one-hour memo of the full agent output skips the geocode, the IBEX
+# round-trips and the stochastic, per-call-priced Bedrock analysis.
+_RESULT_CACHE = AsyncTTLCache(maxsize=512, ttl=3600.0)
+
+
+async def property_valuation_agent(state: AssessmentState) -> dict:
     """PropertyValuationAgent: geocode → IBEX /search → IBEX /stats → planning score."""
+    address = state.address
+    postcode = state.postcode
+
+    cache_key = (postcode.strip().upper(), address.strip().lower())
+    # The per-key lock makes concurrent assessments of the same property wait
+    # for the first one to populate the cache instead of each hitting IBEX.
+    async with _RESULT_CACHE.lock(cache_key):
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for %s — skipping data collection", cache_key)
+            return dict(cached)
+        result = await _run_property_valuation(address, postcode)
+        _RESULT_CACHE.put(cache_key, result)
+        return dict(result)
+
+
+async def _run_property_valuation(address: str, postcode: str) -> dict:
     errors: list[str] = []
-    address = state.get("address", "")
-    postcode = state.get("postcode", "")
-
-    print(f"\n{'='*60}")
-    print(f"[PropertyValuationAgent] Starting")
-    print(f"  address  = {address!r}")
-    print(f"  postcode = {postcode!r}")
-    print(f"{'='*60}")
-
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        # 1. Geocode
-        print(f"[PropertyValuationAgent] Tool: Nominatim geocoding")
-        try:
-            lat, lon = await _geocode(client, address, postcode)
-            print(f"[PropertyValuationAgent] Tool response: lat={lat}, lon={lon}")
-        except Exception as e:
-            errors.append(f"Geocoding failed: {e}")
-            lat, lon = None, None
-            print(f"[PropertyValuationAgent] Geocoding error: {e}")
-
-        if lat is None or lon is None:
-            errors.append("Could not geocode address.")
-            return {
-                "latitude": None,
-                "longitude": None,
-                "raw_planning_data": {},
-                "planning_risk_score": 10.0,
-                "planning_density_label": "Low",
-                "planning_risk_reasoning": "No coordinates — defaulting to low planning risk.",
-                "property_valuation_summary": "Location unknown.",
-                "data_collection_errors": errors,
-            }
-
-        # 2. IBEX /search — local applications (also gives us council_id)
-        print(f"[PropertyValuationAgent] Tool: IBEX POST /search — lat={lat} lon={lon} radius=500m")
-        search_raw = await _fetch_ibex_search(client, lat, lon)
-
-        # 3. Resolve council_id then fetch /stats
-        stats_raw = {}
+
+    logger.debug("=" * 60)
+    logger.debug("Starting")
+    logger.debug("address  = %r", address)
+    logger.debug("postcode = %r", postcode)
+    logger.debug("=" * 60)
+
+    client = get_http_client()
+    # 1. Geocode
+    logger.debug("Tool: Nominatim geocoding")
+    try:
+        lat, lon = await _geocode(client, address, postcode)
+        logger.debug("Tool response: lat=%s, lon=%s", lat, lon)
+    except Exception as e:
+        errors.append(f"Geocoding failed: {e}")
+        lat, lon = None, None
+        logger.warning("Geocoding error: %s", e)
+
+    if lat is None or lon is None:
+        errors.append("Could not geocode address.")
+        return {
+            "latitude": None,
+            "longitude": None,
+            "raw_planning_data": {},
+            "planning_risk_score": 10.0,
+            "planning_density_label": "Low",
+            "planning_risk_reasoning": "No coordinates — defaulting to low planning risk.",
+            "property_valuation_summary": "Location unknown.",
+            "data_collection_errors": errors,
+        }
+
+    # 2. IBEX /search — local applications (also gives us council_id)
+    logger.debug("Tool: IBEX POST /search — lat=%s lon=%s radius=500m", lat, lon)
+    search_raw = await _fetch_ibex_search(client, lat, lon)
+
+    # 3. Everything after /search is independent: council stats, flagged
+    #    application details and the LLM construction analysis only need
+    #    the search result, so overlap their round-trips with gather.
+    async def _stats_coro() -> StatsView:
         council_id = await _resolve_council_id(client, postcode, search_raw)
-        if council_id:
-            print(f"[PropertyValuationAgent] Tool: IBEX POST /stats — council_id={council_id}")
-            stats_raw = await _fetch_ibex_stats(client, council_id)
-        else:
-            print(f"[PropertyValuationAgent] Skipping /stats — no council_id available")
-
-        # 4. Fetch full details for flagged high-risk applications via /applications-by-id
-        risk_keywords = ["demolition", "demolish", "hazardous", "contaminated", "basement excavation", "flood risk"]
-        applications_list = search_raw.get("applications", search_raw.get("results", []))
+        if not council_id:
+            logger.debug("Skipping /stats — no council_id available")
+            return StatsView()
+        logger.debug("Tool: IBEX POST /stats — council_id=%s", council_id)
+        return await _fetch_ibex_stats(client, council_id)
+
+    async def _details_coro() -> list[dict]:
+        applications_list = search_raw.applications
         flagged_apps: list[tuple[int, str]] = []
-        if isinstance(applications_list, list):
-            for app in applications_list:
-                cid = app.get("council_id")
-                ref = app.get("planning_reference")
-                heading = (app.get("heading") or app.get("proposal") or "").lower()
-                has_appeal = bool(app.get("appeal_status") or app.get("appeal_decision"))
-                num_houses = int(app.get("num_new_houses") or 0)
-                is_risky = (
-                    any(kw in heading for kw in risk_keywords)
-                    or has_appeal
-                    or num_houses >= 10
-                )
-                if cid and ref and is_risky:
-                    flagged_apps.append((int(cid), ref))
+        for app, heading, has_appeal, num_houses in zip(
+            applications_list, search_raw.headings, search_raw.has_appeal, search_raw.num_new_houses
+        ):
+            cid = app.get("council_id")
+            ref = app.get("planning_reference")
+            # Cheap boolean/integer checks first so the regex scan over the
+            # heading only runs when they don't already flag the application.
+            is_risky = (
+                bool(has_appeal)
+                or num_houses >= 10
+                or bool(_RISK_RE.search(heading))
+            )
+            if cid and ref and is_risky:
+                flagged_apps.append((int(cid), ref))
         flagged_apps = flagged_apps[:5]
-        detailed_apps: list[dict] = []
-        if flagged_apps:
-            print(f"[PropertyValuationAgent] Tool: IBEX POST /applications-by-id — {len(flagged_apps)} flagged app(s)")
-            detailed_apps = await _fetch_ibex_applications_by_id(client, flagged_apps)
-        else:
-            print(f"[PropertyValuationAgent] No flagged applications — skipping /applications-by-id")
-
-    # 5. LLM construction risk analysis
-    print(f"[PropertyValuationAgent] Tool: Claude (Bedrock) — LLM construction risk analysis")
-    apps_for_llm = applications_list if isinstance(applications_list, list) else []
-    llm_construction = _analyse_construction_risk_with_llm(apps_for_llm)
-
-    # 6. Score
-    score, label, reasoning = _score_planning(stats_raw, search_raw, llm_construction=llm_construction)
-    applications = search_raw.get("applications", search_raw.get("results", []))
-    local_count = len(applications) if isinstance(applications, list) else 0
+        if not flagged_apps:
+            logger.debug("No flagged applications — skipping /applications-by-id")
+            return []
+        logger.debug("Tool: IBEX POST /applications-by-id — %s flagged app(s)", len(flagged_apps))
+        return await _fetch_ibex_applications_by_id(client, flagged_apps)
+
+    logger.debug("Tool: Claude (Bedrock) — LLM construction risk analysis")
+    stats_raw, detailed_apps, llm_construction = await asyncio.gather(
+        _stats_coro(),
+        _details_coro(),
+        _analyse_construction_risk_with_llm(search_raw.applications),
+        return_exceptions=True,
+    )
+    if isinstance(stats_raw, BaseException):
+        errors.append(f"IBEX /stats failed: {stats_raw}")
+        stats_raw = StatsView()
+    if isinstance(detailed_apps, BaseException):
+        errors.append(f"IBEX /applications-by-id failed: {detailed_apps}")
+        detailed_apps = []
+    if isinstance(llm_construction, BaseException):
+        errors.append(f"LLM construction analysis failed: {llm_construction}")
+        llm_construction = {"risk_score": 0, "risk_instances": [], "summary": ""}
+
+    # 6. Score — appeal count comes from the single column pass over /search
+    appeals = int(search_raw.has_appeal.sum())
+    score, label, reasoning = _score_planning(
+        stats_raw, search_raw, llm_construction=llm_construction, appeals=appeals
+    )
+    local_count = len(search_raw.applications)
 
     llm_summary = llm_construction.get("summary", "") if llm_construction else ""
     risk_instances = llm_construction.get("risk_instances", []) if llm_construction else []
-    summary = (
-        f"Property at ({lat:.4f}, {lon:.4f}). "
-        f"Council planning activity: {label}. "
-        f"{local_count} applications within 500 m. "
-        f"Construction risk: {llm_summary} "
-        f"({len(risk_instances)} risk instance(s) identified by LLM analysis)."
-    )
+    summary = "".join((
+        "Property at (", format(lat, ".4f"), ", ", format(lon, ".4f"), "). ",
+        "Council planning activity: ", label, ". ",
+        str(local_count), " applications within 500 m. ",
+        "Construction risk: ", llm_summary, " ",
+        "(", str(len(risk_instances)), " risk instance(s) identified by LLM analysis).",
+    ))
+
+    logger.debug("Done — score=%s label=%r", score, label)
+    logger.debug("reasoning: %s", reasoning)
 
-    print(f"[PropertyValuationAgent] Done — score={score} label={label!r}")
-    print(f"  reasoning: {reasoning}")
+    stored_stats, stored_search = _prune_planning_payloads(stats_raw, search_raw)
 
     return {
         "latitude": lat,
         "longitude": lon,
         "raw_planning_data": {
-            "stats": stats_raw,
-            "search": search_raw,
+            "stats": stored_stats,
+            "search": stored_search,
             "detailed_applications": detailed_apps,
             "llm_construction_risk": llm_construction,
         },
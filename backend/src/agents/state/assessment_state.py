@@ -1,58 +1,70 @@
 import operator
-from typing import Annotated, TypedDict, Optional, List
+from dataclasses import dataclass, field
+from typing import Annotated, List, Optional
 
 
-class AssessmentState(TypedDict, total=False):
+@dataclass(slots=True)
+class AssessmentState:
+    """Shared LangGraph state.
+
+    A slotted dataclass rather than a TypedDict: LangGraph materialises a
+    fresh state view for every node invocation, and slot attribute access is
+    cheaper than hashing ~25 dict keys per read while roughly halving the
+    per-state allocation. Nodes still return partial dicts as updates; only
+    reads go through attributes. Field defaults double as the holding values
+    applied when an upstream agent could not produce data.
+    """
+
     # Input
-    address: str
-    postcode: str
-    user_id: str
+    address: str = ""
+    postcode: str = ""
+    user_id: str = ""
 
     # --- PropertyValuationAgent (IBEX) outputs ---
-    latitude: Optional[float]
-    longitude: Optional[float]
-    raw_planning_data: Optional[dict]
-    property_valuation_summary: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    raw_planning_data: Optional[dict] = None
+    property_valuation_summary: str = ""
 
     # --- FloodRiskAgent outputs ---
-    raw_flood_data: Optional[dict]
-    flood_zone: str                          # "1", "2", "3", "unknown"
-    flood_risk_score: float                  # 0-100
-    flood_risk_reasoning: str
+    raw_flood_data: Optional[dict] = None
+    flood_zone: str = "unknown"              # "1", "2", "3", "unknown"
+    flood_risk_score: float = 20.0           # 0-100
+    flood_risk_reasoning: str = ""
 
     # --- EnvironmentalDataAgent (EPC) outputs ---
-    raw_epc_data: Optional[dict]
-    property_age_band: str
-    property_type: str
-    property_age_risk_score: float           # 0-100
-    property_profile_summary: str
-    property_details: Optional[dict]         # structured EPC fields for display
+    raw_epc_data: Optional[dict] = None
+    property_age_band: str = "unknown"
+    property_type: str = "unknown"
+    property_age_risk_score: float = 30.0    # 0-100
+    property_profile_summary: str = ""
+    property_details: Optional[dict] = None  # structured EPC fields for display
 
     # --- Planning scoring (PropertyValuationAgent) ---
-    planning_risk_score: float               # 0-100
-    planning_risk_reasoning: str
-    planning_density_label: str              # Low / Moderate / High / Very High
+    planning_risk_score: float = 10.0        # 0-100
+    planning_risk_reasoning: str = ""
+    planning_density_label: str = "unknown"  # Low / Moderate / High / Very High
 
     # --- LocalitySafetyAgent outputs ---
-    raw_crime_data: Optional[dict]
-    locality_safety_score: float             # 0-100
-    locality_safety_label: str              # Very Low / Low / Moderate / High / Very High Crime
-    locality_safety_reasoning: str
+    raw_crime_data: Optional[dict] = None
+    locality_safety_score: float = 25.0      # 0-100
+    locality_safety_label: str = "unknown"   # Very Low / Low / Moderate / High / Very High Crime
+    locality_safety_reasoning: str = ""
 
     # --- PolicyAgent (RAG) outputs ---
-    policy_context: List[str]
+    policy_context: List[str] = field(default_factory=list)
 
     # --- CoordinatorAgent (LLM) outputs ---
-    overall_risk_score: float
-    premium_multiplier: float
-    decision: str                            # accept | refer | decline
-    underwriter_reasoning: str
+    overall_risk_score: float = 0.0
+    premium_multiplier: float = 1.0
+    decision: str = "refer"                  # accept | refer | decline
+    underwriter_reasoning: str = ""
 
     # --- ExplainabilityAgent outputs ---
-    risk_factors: List[dict]
-    policy_citations: List[str]
-    plain_english_narrative: str
+    risk_factors: List[dict] = field(default_factory=list)
+    policy_citations: List[str] = field(default_factory=list)
+    plain_english_narrative: str = ""
 
     # List fields written by multiple parallel agents — use operator.add to merge
-    data_collection_errors: Annotated[List[str], operator.add]
-    errors: Annotated[List[str], operator.add]
+    data_collection_errors: Annotated[List[str], operator.add] = field(default_factory=list)
+    errors: Annotated[List[str], operator.add] = field(default_factory=list)
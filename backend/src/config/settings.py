@@ -1,3 +1,4 @@
+from functools import cached_property
 from urllib.parse import quote_plus
 from typing import Optional
 from pydantic_settings import BaseSettings
@@ -11,7 +12,9 @@ class Settings(BaseSettings):
     MONGO_APPNAME: str
     MONGO_DB: str
 
-    @property
+    # cached_property: env vars never change after startup, so the quote_plus
+    # escaping and string assembly run once per process instead of per access.
+    @cached_property
     def mongo_url(self) -> str:
         user = quote_plus(self.MONGO_USER)
         pwd = quote_plus(self.MONGODB_PASSWORD)
@@ -27,6 +30,9 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     BEDROCK_MODEL_ID: str = "us.anthropic.claude-sonnet-4-6"
     BEDROCK_EMBED_MODEL_ID: str = "amazon.titan-embed-text-v2:0"
+    # Routes invoke_model to Bedrock's latency-optimized runtime path;
+    # off by default since not every model supports it
+    BEDROCK_LATENCY_OPTIMIZED: bool = False
 
     # ── JWT ───────────────────────────────────────────────────────────────────
     JWT_SECRET_KEY: str = "changeme"
@@ -42,7 +48,7 @@ class Settings(BaseSettings):
     # ── CORS ──────────────────────────────────────────────────────────────────
     ALLOW_ORIGINS: str = "*"
 
-    @property
+    @cached_property
     def cors_origins(self) -> list[str]:
         if self.ALLOW_ORIGINS == "*":
             return ["*"]
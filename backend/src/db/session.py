@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from src.config.settings import settings
@@ -5,37 +8,69 @@ from src.models.user import User
 from src.models.assessment import PropertyAssessment
 from src.models.underwriting import UnderwritingResult
 from src.models.policy import PolicyChunk
+from src.models.query_embedding import QueryEmbedding
 
 _client: AsyncIOMotorClient | None = None
 
+# Heartbeat: a background task pings Atlas every _HEARTBEAT_INTERVAL seconds
+# and records the last success, so check_connection() answers load-balancer
+# polls from memory instead of spending a connection slot + RTT per poll.
+_HEARTBEAT_INTERVAL = 5.0
+_last_ok_ts: float = 0.0
+_heartbeat_task: asyncio.Task | None = None
+
+
+async def _heartbeat_loop() -> None:
+    global _last_ok_ts
+    while _client is not None:
+        try:
+            await _client.admin.command("ping")
+            _last_ok_ts = time.monotonic()
+        except Exception:
+            pass
+        await asyncio.sleep(_HEARTBEAT_INTERVAL)
+
 
 async def init_db() -> None:
     """Connect to MongoDB Atlas and initialise Beanie ODM."""
-    global _client
+    global _client, _last_ok_ts, _heartbeat_task
 
     print(f"Connecting to MongoDB cluster: {settings.MONGO_CLUSTER} ...")
 
     _client = AsyncIOMotorClient(
         settings.mongo_url,
         serverSelectionTimeoutMS=settings.MONGO_TIMEOUT_MS if hasattr(settings, "MONGO_TIMEOUT_MS") else 5000,
+        # Pool shape: keep a floor of warm connections so the first burst of
+        # logins/assessments after startup (or an idle spell) doesn't pay
+        # Atlas TLS handshakes, and fail fast when the pool is saturated
+        # instead of queueing requests indefinitely.
+        minPoolSize=10,
+        maxPoolSize=50,
+        maxIdleTimeMS=120_000,
+        waitQueueTimeoutMS=5_000,
     )
 
     db = _client[settings.MONGO_DB]
 
     # Verify connection
     await _client.admin.command("ping")
+    _last_ok_ts = time.monotonic()
     print(f"Connected to MongoDB: {settings.MONGO_DB}")
 
     await init_beanie(
         database=db,
-        document_models=[User, PropertyAssessment, UnderwritingResult, PolicyChunk],
+        document_models=[User, PropertyAssessment, UnderwritingResult, PolicyChunk, QueryEmbedding],
     )
+    _heartbeat_task = asyncio.create_task(_heartbeat_loop())
     print("Beanie ODM initialised")
 
 
 async def close_db() -> None:
     """Close the MongoDB connection gracefully."""
-    global _client
+    global _client, _heartbeat_task
+    if _heartbeat_task:
+        _heartbeat_task.cancel()
+        _heartbeat_task = None
     if _client:
         _client.close()
         _client = None
@@ -43,11 +78,19 @@ async def close_db() -> None:
 
 
 async def check_connection() -> bool:
-    """Return True if the MongoDB connection is alive."""
+    """Return True if the MongoDB connection is alive.
+
+    Served from the heartbeat's last-success timestamp when fresh; only
+    falls back to a live ping if the heartbeat has gone stale.
+    """
+    global _last_ok_ts
     if _client is None:
         return False
+    if time.monotonic() - _last_ok_ts < _HEARTBEAT_INTERVAL:
+        return True
     try:
         await _client.admin.command("ping")
+        _last_ok_ts = time.monotonic()
         return True
     except Exception:
         return False
@@ -1,22 +1,96 @@
+import logging
+import logging.handlers
+import queue
+import sys
 import traceback
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from src.agents.nodes.property_valuation_agent import aclose_http_client
 from src.config.settings import settings
 from src.db.session import init_db, close_db
 from src.services.policy_service import seed_policies_if_empty
+from src.utils.geocoding import aclose_geocoding_client
 from src.v1.routes.auth import router as auth_router
 from src.v1.routes.underwriting import router as underwriting_router
 
 
+def _setup_queue_logging() -> logging.handlers.QueueListener:
+    """Route app logging through a queue so stdout writes (line-buffered and
+    blocking under Docker) happen on the listener thread, not the event loop."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    listener = _setup_queue_logging()
     await init_db()
     await seed_policies_if_empty()
     yield
+    await aclose_http_client()
+    await aclose_geocoding_client()
     await close_db()
+    listener.stop()
+
+
+# CORS configuration is static for the process lifetime, so the header
+# lists are encoded once at import instead of per request.
+_ALLOW_ORIGIN_VALUE = ", ".join(settings.cors_origins)
+_CORS_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", _ALLOW_ORIGIN_VALUE.encode()),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-expose-headers", b"*"),
+]
+_PREFLIGHT_HEADERS: list[tuple[bytes, bytes]] = _CORS_HEADERS + [
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-max-age", b"600"),
+]
+
+
+class RawCORSMiddleware:
+    """Minimal pure-ASGI CORS layer.
+
+    Starlette's CORSMiddleware rebuilds its header set per request; the
+    origins here come from static settings, so simple responses just get
+    the precomputed constant list appended in a single pass and preflight
+    OPTIONS requests short-circuit without touching the router.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": list(_PREFLIGHT_HEADERS),
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + _CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
 
 
 app = FastAPI(
@@ -25,25 +99,23 @@ app = FastAPI(
     description="Multi-agent UK residential property insurance underwriting system",
     lifespan=lifespan,
     swagger_ui_parameters={"persistAuthorization": True},
+    # orjson renders response bodies in native code — the history endpoint's
+    # list payloads are where the default json.dumps path shows up in profiles
+    default_response_class=ORJSONResponse,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-)
+app.add_middleware(RawCORSMiddleware)
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
+    # 500s surface from the outermost error middleware and bypass the CORS
+    # layer, so the allow-origin header is set here explicitly.
     traceback.print_exc()
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": str(exc) or "Internal server error"},
-        headers={"Access-Control-Allow-Origin": "*"},
+        headers={"Access-Control-Allow-Origin": _ALLOW_ORIGIN_VALUE},
     )
 
 
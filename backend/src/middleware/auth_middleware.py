@@ -6,6 +6,8 @@ from src.utils.jwt import decode_token
 # OpenAPI spec → the "Authorize" button and lock icons appear in Swagger UI.
 security = HTTPBearer(auto_error=True)
 
+_WWW_AUTHENTICATE = {"WWW-Authenticate": "Bearer"}
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -13,6 +15,12 @@ async def get_current_user(
     """
     Reusable auth dependency — extracts and validates the Bearer JWT.
     Raises 401 if the token is missing or invalid.
+
+    FastAPI caches this sub-dependency per request (use_cache defaults to
+    True), so a route that needs the user id in several places still decodes
+    the token at most once per request. Mongo access underneath goes through
+    the single shared motor client, so auth checks and service queries
+    already draw from the same connection pool.
     """
     payload = decode_token(credentials.credentials)
     user_id = payload.get("sub")
@@ -20,6 +28,6 @@ async def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTHENTICATE,
         )
     return user_id
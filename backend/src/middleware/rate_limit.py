@@ -0,0 +1,46 @@
+import time
+
+from fastapi import HTTPException, Request, status
+
+# Per-IP fixed-window limiter for the auth routes. bcrypt verification is
+# the most expensive operation in the app, so credential-stuffing traffic
+# is rejected here — before the hash ever runs. In-process state is enough
+# for the single-worker deployment; everything runs on the event loop so
+# no locking is needed.
+_WINDOW_S = 60.0
+_MAX_ATTEMPTS = 10
+_MAX_ENTRIES = 10_000
+_counters: dict[str, tuple[float, int]] = {}
+
+_RETRY_AFTER = {"Retry-After": "60"}
+
+
+def _client_ip(request: Request) -> str:
+    # nginx fronts the app, so the real address arrives in X-Forwarded-For
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def auth_rate_limit(request: Request) -> None:
+    """Dependency: allow at most _MAX_ATTEMPTS auth calls per IP per minute."""
+    now = time.monotonic()
+    ip = _client_ip(request)
+    entry = _counters.get(ip)
+    if entry is None:
+        # Bound memory: reset all counters rather than tracking LRU order
+        if len(_counters) >= _MAX_ENTRIES:
+            _counters.clear()
+        entry = (now, 0)
+    elif now - entry[0] >= _WINDOW_S:
+        entry = (now, 0)
+    window_start, count = entry
+    count += 1
+    _counters[ip] = (window_start, count)
+    if count > _MAX_ATTEMPTS:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts — please try again shortly",
+            headers=_RETRY_AFTER,
+        )
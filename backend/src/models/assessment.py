@@ -1,14 +1,17 @@
 from beanie import Document, PydanticObjectId
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
 from typing import List
 from datetime import datetime, timezone
 
 
 class RiskFactor(BaseModel):
-    name: str
-    score: float
-    weight: float
-    reasoning: str
+    # Defaults mirror the old .get() fallbacks so a partial dict from an
+    # agent validates instead of erroring the whole save.
+    name: str = ""
+    score: float = 0.0
+    weight: float = 0.0
+    reasoning: str = ""
 
 
 class PropertyAssessment(Document):
@@ -25,7 +28,9 @@ class PropertyAssessment(Document):
     risk_factors: List[RiskFactor] = []
     plain_english_narrative: str = ""
     data_warnings: List[str] = []
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "property_assessments"
+        # Compound index covers the history query (filter by user, newest first)
+        indexes = [IndexModel([("user_id", 1), ("created_at", -1)])]
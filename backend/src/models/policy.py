@@ -1,4 +1,5 @@
 from beanie import Document
+from pymongo import IndexModel
 from typing import List
 
 
@@ -7,6 +8,9 @@ class PolicyChunk(Document):
     section: str
     content: str
     embedding: List[float]
+    # SHA-256 of content — lets startup seeding re-embed only changed text
+    content_hash: str = ""
 
     class Settings:
         name = "policy_chunks"
+        indexes = [IndexModel([("policy_name", 1), ("section", 1)])]
@@ -0,0 +1,23 @@
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+from datetime import datetime, timezone
+
+
+class QueryEmbedding(Document):
+    """Cached Bedrock embedding for a RAG query, keyed by SHA-256 of the text.
+
+    Turns repeat embeds of the same templated query into an indexed Mongo
+    point lookup; Mongo's TTL monitor expires entries after a day.
+    """
+
+    query_hash: str
+    embedding: list[float]
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        name = "query_embeddings"
+        indexes = [
+            IndexModel([("query_hash", 1)], unique=True),
+            IndexModel([("created_at", 1)], expireAfterSeconds=86400),
+        ]
@@ -1,4 +1,5 @@
 from beanie import Document, PydanticObjectId
+from pydantic import Field
 from datetime import datetime, timezone
 
 
@@ -6,7 +7,7 @@ class UnderwritingResult(Document):
     assessment_id: PydanticObjectId
     underwriter_reasoning: str = ""
     policy_citations: list[str] = []
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "underwriting_results"
@@ -1,12 +1,16 @@
 from beanie import Document
-from pydantic import EmailStr
+from pydantic import EmailStr, Field
+from pymongo import IndexModel
 from datetime import datetime, timezone
 
 
 class User(Document):
     email: EmailStr
     hashed_password: str
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "users"
+        # Every login/register does a lookup by email — index it (and enforce
+        # uniqueness at the DB layer rather than only in application code)
+        indexes = [IndexModel([("email", 1)], unique=True)]
@@ -1,5 +1,18 @@
 from beanie import PydanticObjectId
-from src.models.assessment import PropertyAssessment
+from beanie.operators import In
+from pydantic import BaseModel, Field
+from src.models.assessment import PropertyAssessment, RiskFactor
+
+
+class AssessmentSummary(BaseModel):
+    """Projection for list views — skips the heavy narrative/risk-factor
+    fields so Mongo only ships the scalar columns over the wire."""
+
+    address: str
+    postcode: str
+    decision: str
+    overall_risk_score: float
+    premium_multiplier: float
 
 
 async def save_assessment(assessment: PropertyAssessment) -> PropertyAssessment:
@@ -8,4 +21,68 @@ async def save_assessment(assessment: PropertyAssessment) -> PropertyAssessment:
 
 
 async def get_assessments_by_user(user_id: PydanticObjectId) -> list[PropertyAssessment]:
-    return await PropertyAssessment.find(PropertyAssessment.user_id == user_id).to_list()
+    return await (
+        PropertyAssessment.find(PropertyAssessment.user_id == user_id)
+        .sort(-PropertyAssessment.created_at)
+        .to_list()
+    )
+
+
+class AssessmentHistoryView(BaseModel):
+    """Projection for the history endpoint — every field the response needs,
+    minus the filter key (user_id) and address columns that never leave the
+    backend. Rides the (user_id, created_at) compound index newest-first."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    decision: str
+    overall_risk_score: float
+    premium_multiplier: float
+    flood_risk_score: float
+    planning_risk_score: float
+    property_age_risk_score: float
+    locality_safety_score: float = 25.0
+    risk_factors: list[RiskFactor] = []
+    plain_english_narrative: str = ""
+    data_warnings: list[str] = []
+
+
+async def get_assessment_history_by_user(user_id: PydanticObjectId) -> list[AssessmentHistoryView]:
+    # batch_size keeps long histories flowing in few cursor round-trips
+    return await (
+        PropertyAssessment.find(PropertyAssessment.user_id == user_id, batch_size=100)
+        .sort(-PropertyAssessment.created_at)
+        .project(AssessmentHistoryView)
+        .to_list()
+    )
+
+
+class _BatchHistoryView(AssessmentHistoryView):
+    """History projection plus the user_id needed to re-group a batched read."""
+
+    user_id: PydanticObjectId
+
+
+async def get_assessment_histories_by_users(
+    user_ids: list[PydanticObjectId],
+) -> dict[PydanticObjectId, list[AssessmentHistoryView]]:
+    """Batched history read: one $in query for several users, results
+    re-grouped per user with newest-first order preserved."""
+    docs = await (
+        PropertyAssessment.find(In(PropertyAssessment.user_id, user_ids), batch_size=100)
+        .sort(-PropertyAssessment.created_at)
+        .project(_BatchHistoryView)
+        .to_list()
+    )
+    grouped: dict[PydanticObjectId, list[AssessmentHistoryView]] = {u: [] for u in user_ids}
+    for doc in docs:
+        grouped[doc.user_id].append(doc)
+    return grouped
+
+
+async def get_assessment_summaries_by_user(user_id: PydanticObjectId) -> list[AssessmentSummary]:
+    return await (
+        PropertyAssessment.find(PropertyAssessment.user_id == user_id)
+        .sort(-PropertyAssessment.created_at)
+        .project(AssessmentSummary)
+        .to_list()
+    )
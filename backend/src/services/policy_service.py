@@ -8,9 +8,19 @@ Handles:
   - Falling back to simple .find().limit() if the vector index is not yet configured
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import time
+
 import boto3
+import numpy as np
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import DeleteMany, UpdateOne
 from src.models.policy import PolicyChunk
+from src.models.query_embedding import QueryEmbedding
 from src.config.settings import settings
 
 POLICY_SEED_DATA = [
@@ -243,7 +253,29 @@ POLICY_SEED_DATA = [
 ]
 
 
+class _ChunkText(BaseModel):
+    """Projection for fallback reads: just the text fields, never the 4 KB
+    FP32 embedding array. In-index compression of the vectors themselves is
+    an Atlas setting ("quantization": "scalar" on policy_vector_index), not
+    something the driver controls."""
+
+    policy_name: str
+    section: str
+    content: str
+
+
+def _perf_kwargs() -> dict:
+    """Extra invoke_model kwargs when latency-optimized inference is enabled."""
+    if settings.BEDROCK_LATENCY_OPTIMIZED:
+        return {"performanceConfigLatency": "optimized"}
+    return {}
+
+
+@functools.cache
 def _bedrock_client():
+    """Shared Bedrock client — construction parses service models and builds
+    signer state (tens of ms), so build it once and reuse the warm TLS pool
+    across seeding and every retrieval embedding."""
     return boto3.client("bedrock-runtime", region_name=settings.AWS_REGION)
 
 
@@ -255,68 +287,318 @@ def embed_text(text: str) -> list[float]:
         body=json.dumps({"inputText": text}),
         contentType="application/json",
         accept="application/json",
+        **_perf_kwargs(),
     )
     body = json.loads(response["body"].read())
     return body["embedding"]
 
 
+# Cohere embed models accept up to 96 texts per request; Titan is single-text
+_COHERE_BATCH_LIMIT = 96
+
+
+def _embed_batch_cohere(texts: list[str]) -> list[list[float]]:
+    client = _bedrock_client()
+    embeddings: list[list[float]] = []
+    for start in range(0, len(texts), _COHERE_BATCH_LIMIT):
+        batch = texts[start:start + _COHERE_BATCH_LIMIT]
+        response = client.invoke_model(
+            modelId=settings.BEDROCK_EMBED_MODEL_ID,
+            body=json.dumps({"texts": batch, "input_type": "search_document"}),
+            contentType="application/json",
+            accept="application/json",
+            **_perf_kwargs(),
+        )
+        body = json.loads(response["body"].read())
+        embeddings.extend(body["embeddings"])
+    return embeddings
+
+
+async def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Embed many texts with as few Bedrock round-trips as the model allows.
+
+    Cohere embed models take up to 96 texts per request, collapsing the whole
+    seed corpus into one call; Titan only embeds one text per request, so it
+    falls back to concurrent single-text calls capped at 8 in flight.
+    Failed texts come back as zero vectors (correct dims) rather than
+    aborting the batch.
+    """
+    if settings.BEDROCK_EMBED_MODEL_ID.startswith("cohere."):
+        try:
+            return await asyncio.to_thread(_embed_batch_cohere, texts)
+        except Exception as e:
+            print(f"[PolicyService] Batch embedding failed: {e} — zero vectors")
+            return [[0.0] * 1024 for _ in texts]
+
+    sem = asyncio.Semaphore(8)
+
+    async def _one(text: str) -> list[float]:
+        async with sem:
+            try:
+                return await asyncio.to_thread(embed_text, text)
+            except Exception:
+                return [0.0] * 1024  # zero vector fallback (correct dims)
+
+    return list(await asyncio.gather(*(_one(t) for t in texts)))
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class _ChunkMeta(BaseModel):
+    """Startup-sync projection: identity, content hash and the stored vector
+    (the latter only to catch wrong dims / failed zero-vector embeds)."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    policy_name: str
+    section: str
+    content_hash: str = ""
+    embedding: list[float] = []
+
+
 async def seed_policies_if_empty() -> None:
-    """Insert policy chunks with embeddings on first startup. Re-seeds if stale."""
-    count = await PolicyChunk.count()
-    expected = len(POLICY_SEED_DATA)
-
-    if count > 0:
-        sample = await PolicyChunk.find_one()
-        wrong_dims = sample and sample.embedding and len(sample.embedding) != 1024
-        stale_count = count != expected
-
-        if wrong_dims:
-            print(f"[PolicyService] Wrong embedding dims ({len(sample.embedding)}) — re-seeding")
-            await PolicyChunk.delete_all()
-        elif stale_count:
-            print(f"[PolicyService] Policy count changed ({count} → {expected}) — re-seeding")
-            await PolicyChunk.delete_all()
+    """Differentially sync policy_chunks against POLICY_SEED_DATA.
+
+    The old behaviour dropped the whole collection and re-embedded every
+    chunk whenever the count drifted. Now each seed row carries a content
+    hash, so only new or changed texts (or rows whose stored embedding is
+    broken) cost a Bedrock embed; stale rows are deleted; an in-sync
+    corpus costs a single projected read.
+    """
+    expected = {(c["policy_name"], c["section"]): c for c in POLICY_SEED_DATA}
+    metas = await PolicyChunk.find_all().project(_ChunkMeta).to_list()
+
+    by_key: dict[tuple[str, str], _ChunkMeta] = {}
+    remove_ids: list[PydanticObjectId] = []
+    for m in metas:
+        key = (m.policy_name, m.section)
+        if key in expected and key not in by_key:
+            by_key[key] = m
         else:
-            print(f"[PolicyService] {count} policy chunks already seeded — skipping")
-            return
+            remove_ids.append(m.id)  # removed from the seed data, or a duplicate
+
+    new_rows: list[tuple[dict, str]] = []
+    changed: list[tuple[PydanticObjectId, dict, str]] = []
+    for key, chunk_data in expected.items():
+        digest = _content_hash(chunk_data["content"])
+        meta = by_key.get(key)
+        if meta is None:
+            new_rows.append((chunk_data, digest))
+        elif (
+            meta.content_hash != digest
+            or len(meta.embedding) != 1024
+            or not any(meta.embedding)  # zero-vector left by a failed embed
+        ):
+            changed.append((meta.id, chunk_data, digest))
 
-    print(f"[PolicyService] Seeding {expected} policy chunks...")
-    for chunk_data in POLICY_SEED_DATA:
+    if not new_rows and not changed and not remove_ids:
+        print(f"[PolicyService] {len(metas)} policy chunks in sync — skipping")
+        return
+
+    print(
+        f"[PolicyService] Syncing policy chunks: "
+        f"{len(new_rows)} new, {len(changed)} changed, {len(remove_ids)} removed"
+    )
+
+    texts = [c["content"] for c, _ in new_rows] + [c["content"] for _, c, _ in changed]
+    embeddings = await embed_texts(texts) if texts else []
+    new_embeddings = embeddings[: len(new_rows)]
+    changed_embeddings = embeddings[len(new_rows):]
+
+    if new_rows:
+        # One bulk write instead of a Mongo round-trip per chunk; unordered so
+        # the server can apply the batch without serialising on document order
+        await PolicyChunk.insert_many(
+            [
+                PolicyChunk(
+                    policy_name=chunk_data["policy_name"],
+                    section=chunk_data["section"],
+                    content=chunk_data["content"],
+                    embedding=embedding,
+                    content_hash=digest,
+                )
+                for (chunk_data, digest), embedding in zip(new_rows, new_embeddings)
+            ],
+            ordered=False,
+        )
+
+    ops: list = [
+        UpdateOne(
+            {"_id": doc_id},
+            {"$set": {
+                "content": chunk_data["content"],
+                "embedding": embedding,
+                "content_hash": digest,
+            }},
+        )
+        for (doc_id, chunk_data, digest), embedding in zip(changed, changed_embeddings)
+    ]
+    if remove_ids:
+        ops.append(DeleteMany({"_id": {"$in": remove_ids}}))
+    if ops:
+        await PolicyChunk.get_motor_collection().bulk_write(ops, ordered=False)
+
+    # The in-process corpus matrix (if already loaded) is now stale
+    global _corpus_matrix, _corpus_payloads
+    _corpus_matrix = None
+    _corpus_payloads = None
+
+
+# Query caches: the RAG query is templated from a handful of discrete risk
+# values, so assessments frequently repeat it verbatim or near-verbatim.
+# An exact-match memo skips both the Bedrock embed and the vector search;
+# a cosine-similarity memo over past query embeddings (in-process numpy —
+# the corpus is tiny, no ANN index needed) catches near-duplicates.
+_QUERY_CACHE_TTL = 300.0
+_QUERY_CACHE_MAX = 1000
+_SEM_SIM_THRESHOLD = 0.92
+_exact_cache: dict[str, tuple[float, list[str]]] = {}
+_sem_vectors: np.ndarray = np.empty((0, 1024), dtype=np.float32)
+_sem_entries: list[tuple[float, list[str]]] = []
+
+
+def _semantic_lookup(vec: np.ndarray) -> list[str] | None:
+    if not _sem_entries:
+        return None
+    sims = _sem_vectors @ vec
+    best = int(np.argmax(sims))
+    if sims[best] >= _SEM_SIM_THRESHOLD:
+        expires_at, payload = _sem_entries[best]
+        if expires_at > time.monotonic():
+            return payload
+    return None
+
+
+def _semantic_store(vec: np.ndarray, payload: list[str]) -> None:
+    global _sem_vectors
+    _sem_vectors = np.vstack((_sem_vectors, vec[None, :]))
+    _sem_entries.append((time.monotonic() + _QUERY_CACHE_TTL, payload))
+    if len(_sem_entries) > _QUERY_CACHE_MAX:
+        drop = len(_sem_entries) - _QUERY_CACHE_MAX
+        del _sem_entries[:drop]
+        _sem_vectors = _sem_vectors[drop:]
+
+
+# In-process exact retrieval: the whole policy corpus is ~25 seeded chunks,
+# so once their normalised embeddings sit in a numpy matrix, top-k is an
+# exact 25x1024 matvec — microseconds, no Atlas round-trip, and none of the
+# ANN recall loss $vectorSearch trades for scale it doesn't need here.
+_corpus_lock = asyncio.Lock()
+_corpus_matrix: np.ndarray | None = None
+_corpus_payloads: list[str] | None = None
+
+
+async def _corpus() -> tuple[np.ndarray, list[str]] | None:
+    global _corpus_matrix, _corpus_payloads
+    if _corpus_matrix is not None:
+        return _corpus_matrix, _corpus_payloads
+    async with _corpus_lock:
+        if _corpus_matrix is not None:
+            return _corpus_matrix, _corpus_payloads
         try:
-            embedding = embed_text(chunk_data["content"])
+            chunks = await PolicyChunk.find_all().to_list()
         except Exception:
-            embedding = [0.0] * 1024  # zero vector fallback (correct dims)
+            return None
+        vectors: list[list[float]] = []
+        payloads: list[str] = []
+        for c in chunks:
+            # Skip the zero-vector fallbacks a failed seed embed leaves behind
+            if c.embedding and len(c.embedding) == 1024 and any(c.embedding):
+                vectors.append(c.embedding)
+                payloads.append(f"[{c.policy_name} – {c.section}]: {c.content}")
+        if not vectors:
+            return None
+        matrix = np.asarray(vectors, dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        _corpus_matrix, _corpus_payloads = matrix, payloads
+        return matrix, payloads
 
-        chunk = PolicyChunk(
-            policy_name=chunk_data["policy_name"],
-            section=chunk_data["section"],
-            content=chunk_data["content"],
-            embedding=embedding,
-        )
-        await chunk.insert()
+
+def _remember(query: str, now: float, vec: np.ndarray, norm: float, payload: list[str]) -> None:
+    if len(_exact_cache) > _QUERY_CACHE_MAX:
+        _exact_cache.clear()
+    _exact_cache[query] = (now + _QUERY_CACHE_TTL, payload)
+    if norm > 0:
+        _semantic_store(vec, payload)
 
 
 async def retrieve_relevant_policies(query: str, top_k: int = 3) -> list[str]:
     """Retrieve top-k policy chunks relevant to the query via vector search."""
+    now = time.monotonic()
+    exact = _exact_cache.get(query)
+    if exact is not None and exact[0] > now:
+        print("[PolicyService] Exact query cache hit — skipping embed + search")
+        return list(exact[1])
+
+    # Persisted embedding cache: survives restarts and is shared across
+    # workers, so a re-run of a known query costs a Mongo point lookup
+    # instead of a Bedrock round-trip. Entries TTL out after a day.
+    query_hash = hashlib.sha256(query.encode()).hexdigest()
+    try:
+        stored = await QueryEmbedding.find_one(QueryEmbedding.query_hash == query_hash)
+    except Exception:
+        stored = None
+
     try:
-        query_embedding = embed_text(query)
-        print(f"[PolicyService] Embedding generated ({len(query_embedding)} dims)")
+        if stored is not None:
+            query_embedding = stored.embedding
+            print("[PolicyService] Query embedding served from Mongo cache")
+        else:
+            # embed_text is a blocking boto3 call — run it on a worker thread
+            # so the event loop keeps serving other assessments during the RTT
+            query_embedding = await asyncio.to_thread(embed_text, query)
+            print(f"[PolicyService] Embedding generated ({len(query_embedding)} dims)")
+            try:
+                await QueryEmbedding(query_hash=query_hash, embedding=query_embedding).insert()
+            except Exception:
+                pass  # concurrent insert of the same hash — the cache entry exists
     except Exception as e:
         print(f"[PolicyService] Embedding failed: {e} — falling back to find().limit()")
-        chunks = await PolicyChunk.find().limit(top_k).to_list()
+        chunks = await PolicyChunk.find().limit(top_k).project(_ChunkText).to_list()
         return [f"[{c.policy_name} – {c.section}]: {c.content}" for c in chunks]
 
+    vec = np.asarray(query_embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec /= norm
+        cached = _semantic_lookup(vec)
+        if cached is not None:
+            print("[PolicyService] Semantic query cache hit — skipping vector search")
+            _exact_cache[query] = (now + _QUERY_CACHE_TTL, cached)
+            return list(cached)
+
+    if norm > 0:
+        corpus = await _corpus()
+        if corpus is not None:
+            matrix, payloads = corpus
+            sims = matrix @ vec
+            # argpartition selects top-k in O(N); the final sort only ranks k
+            k = min(top_k, len(payloads))
+            top = np.argpartition(-sims, k - 1)[:k]
+            order = top[np.argsort(-sims[top])]
+            payload = [payloads[int(i)] for i in order]
+            print(f"[PolicyService] In-process exact search returned {len(payload)} chunk(s) — SEMANTIC MATCH")
+            _remember(query, now, vec, norm, payload)
+            return list(payload)
+
+    # Atlas fallback when the corpus can't be loaded (e.g. Mongo hiccup
+    # mid-request) or the query embedding came back degenerate.
+    # numCandidates scales with top_k (Atlas recommends 10–20x the limit);
+    # a fixed 50 over-traverses the HNSW graph for top_k=3. The projection
+    # drops _id too so only the three small text fields cross the wire —
+    # in particular the 4 KB embedding never leaves the server.
     pipeline = [
         {
             "$vectorSearch": {
                 "index": "policy_vector_index",
                 "path": "embedding",
                 "queryVector": query_embedding,
-                "numCandidates": 50,
+                "numCandidates": max(10 * top_k, 20),
                 "limit": top_k,
             }
         },
-        {"$project": {"policy_name": 1, "section": 1, "content": 1}},
+        {"$project": {"_id": 0, "policy_name": 1, "section": 1, "content": 1}},
     ]
 
     try:
@@ -324,8 +606,10 @@ async def retrieve_relevant_policies(query: str, top_k: int = 3) -> list[str]:
         if not results:
             raise ValueError("Empty vector search results")
         print(f"[PolicyService] Vector search returned {len(results)} chunk(s) — SEMANTIC MATCH")
-        return [f"[{r['policy_name']} – {r['section']}]: {r['content']}" for r in results]
+        payload = [f"[{r['policy_name']} – {r['section']}]: {r['content']}" for r in results]
+        _remember(query, now, vec, norm, payload)
+        return list(payload)
     except Exception as e:
         print(f"[PolicyService] Vector search failed: {e} — falling back to find().limit()")
-        chunks = await PolicyChunk.find().limit(top_k).to_list()
+        chunks = await PolicyChunk.find().limit(top_k).project(_ChunkText).to_list()
         return [f"[{c.policy_name} – {c.section}]: {c.content}" for c in chunks]
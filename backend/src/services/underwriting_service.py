@@ -1,27 +1,51 @@
+import asyncio
 import json
-from typing import AsyncIterator
+from typing import AsyncIterator, Final
 
 from beanie import PydanticObjectId
+from src.agents.cache import AsyncTTLCache
 from src.agents.graph import assessment_graph
-from src.agents.state.assessment_state import AssessmentState
 from src.models.assessment import PropertyAssessment, RiskFactor
+from src.repositories.assessment_repository import (
+    AssessmentHistoryView,
+    get_assessment_histories_by_users,
+)
 from src.models.underwriting import UnderwritingResult
 from src.schemas.underwriting import AssessmentResponse
 
+# frozenset: these are membership-test constants hit on every stream update,
+# and freezing them rules out accidental mutation from a future edit.
+
 # Agents that run in parallel after PropertyValuationAgent completes
-_PARALLEL_AGENTS = {"FloodRiskAgent", "EnvironmentalDataAgent", "LocalitySafetyAgent"}
+_PARALLEL_AGENTS: Final[frozenset[str]] = frozenset(
+    {"FloodRiskAgent", "EnvironmentalDataAgent", "LocalitySafetyAgent"}
+)
 
 # All known agent node names (for filtering stream events)
-_AGENT_IDS = {
+_AGENT_IDS: Final[frozenset[str]] = frozenset({
     "PropertyValuationAgent", "FloodRiskAgent", "EnvironmentalDataAgent",
     "LocalitySafetyAgent", "PolicyAgent", "CoordinatorAgent", "ExplainabilityAgent",
-}
+})
+
+# List fields that accumulate across agents (operator.add in AssessmentState)
+_LIST_APPEND_FIELDS: Final[frozenset[str]] = frozenset(
+    {"data_collection_errors", "errors", "policy_context", "risk_factors", "policy_citations"}
+)
+
+
+def _sse(payload: dict) -> str:
+    return f"data: {json.dumps(payload)}\n\n"
+
 
-# List fields that accumulate across agents (operator.add in state TypedDict)
-_LIST_APPEND_FIELDS = {"data_collection_errors", "errors", "policy_context", "risk_factors", "policy_citations"}
+# The lifecycle events carry no per-run data, so their SSE frames are
+# serialized once at import instead of json.dumps-ing per event per run.
+_EVT_START = {a: _sse({"type": "agent_start", "agent": a}) for a in _AGENT_IDS}
+_EVT_END = {a: _sse({"type": "agent_end", "agent": a}) for a in _AGENT_IDS}
 
 
-def _initial_state(address: str, postcode: str, user_id: str) -> AssessmentState:
+def _initial_state(address: str, postcode: str, user_id: str) -> dict:
+    # LangGraph coerces this dict into the AssessmentState dataclass per channel;
+    # graph output comes back as a plain dict of channel values.
     return {
         "address": address,
         "postcode": postcode,
@@ -35,31 +59,41 @@ def _initial_state(address: str, postcode: str, user_id: str) -> AssessmentState
 
 
 def _merge(state: dict, update: dict) -> dict:
-    """Merge a node's output into the accumulated state, appending list fields."""
-    result = dict(state)
+    """Merge a node's output into the accumulated state, appending list fields.
+
+    Mutates ``state`` in place and returns it: the streaming loop owns the
+    dict (built fresh by _initial_state per run), so copying the whole dict
+    plus every accumulator list on each graph update would be O(state size)
+    per update for nothing. Node outputs are never aliased — list fields are
+    copied on first sight before extend.
+    """
     for k, v in update.items():
         if k in _LIST_APPEND_FIELDS and isinstance(v, list):
-            result[k] = list(result.get(k) or []) + v
+            existing = state.get(k)
+            if existing is None:
+                state[k] = list(v)
+            else:
+                existing.extend(v)
         else:
-            result[k] = v
-    return result
+            state[k] = v
+    return state
 
 
 async def _save_and_build_response(
     final_state: dict, address: str, postcode: str, user_id: str
 ) -> AssessmentResponse:
     """Persist assessment to MongoDB and return the API response."""
+    # model_validate runs in pydantic-core (Rust): one call per factor with
+    # coercion handled there, instead of four .get() lookups + float() casts
     risk_factors = [
-        RiskFactor(
-            name=rf.get("name", ""),
-            score=float(rf.get("score", 0)),
-            weight=float(rf.get("weight", 0)),
-            reasoning=rf.get("reasoning", ""),
-        )
-        for rf in (final_state.get("risk_factors") or [])
+        RiskFactor.model_validate(rf) for rf in (final_state.get("risk_factors") or [])
     ]
 
     assessment = PropertyAssessment(
+        # Pre-assigned id: UnderwritingResult only needs the assessment's
+        # ObjectId, and generating it client-side lets both inserts go to
+        # Mongo concurrently instead of waiting on the first ack for the id.
+        id=PydanticObjectId(),
         user_id=PydanticObjectId(user_id),
         address=address,
         postcode=postcode,
@@ -74,14 +108,16 @@ async def _save_and_build_response(
         plain_english_narrative=final_state.get("plain_english_narrative", ""),
         data_warnings=(final_state.get("data_collection_errors") or []) + (final_state.get("errors") or []),
     )
-    await assessment.insert()
-
     underwriting_result = UnderwritingResult(
         assessment_id=assessment.id,
         underwriter_reasoning=final_state.get("underwriter_reasoning", ""),
         policy_citations=final_state.get("policy_citations", []),
     )
-    await underwriting_result.insert()
+    # One round-trip of wall-clock time for the finalize step: the two
+    # documents live in different collections, so this is two writes on the
+    # wire but overlapped rather than sequential.
+    await asyncio.gather(assessment.insert(), underwriting_result.insert())
+    _HISTORY_CACHE.invalidate(user_id)
 
     return AssessmentResponse(
         assessment_id=str(assessment.id),
@@ -92,17 +128,30 @@ async def _save_and_build_response(
         planning_risk_score=assessment.planning_risk_score,
         property_age_risk_score=assessment.property_age_risk_score,
         locality_safety_score=assessment.locality_safety_score,
-        risk_factors=[
-            {"name": rf.name, "score": rf.score, "weight": rf.weight, "reasoning": rf.reasoning}
-            for rf in risk_factors
-        ],
+        risk_factors=[rf.model_dump() for rf in risk_factors],
         plain_english_narrative=assessment.plain_english_narrative,
         data_warnings=assessment.data_warnings,
         property_details=final_state.get("property_details") or None,
     )
 
 
+# Duplicate submissions of the same property by the same user (double-clicks,
+# client retries) collapse into one in-flight graph run: followers await the
+# leader's task and share its response, so only one assessment is saved.
+_INFLIGHT_ASSESS: dict[tuple[str, str, str], asyncio.Task] = {}
+
+
 async def run_assessment(address: str, postcode: str, user_id: str) -> AssessmentResponse:
+    key = (user_id, address.strip().lower(), postcode.strip().lower())
+    task = _INFLIGHT_ASSESS.get(key)
+    if task is None:
+        task = asyncio.create_task(_run_assessment(address, postcode, user_id))
+        _INFLIGHT_ASSESS[key] = task
+        task.add_done_callback(lambda _t, _k=key: _INFLIGHT_ASSESS.pop(_k, None))
+    return await task
+
+
+async def _run_assessment(address: str, postcode: str, user_id: str) -> AssessmentResponse:
     final_state = await assessment_graph.ainvoke(_initial_state(address, postcode, user_id))
     return await _save_and_build_response(final_state, address, postcode, user_id)
 
@@ -119,73 +168,155 @@ async def run_assessment_streaming(
       {"type": "agent_end",   "agent": "AgentName"}
       {"type": "result",      "data": {...AssessmentResponse...}}
     """
-    def _sse(payload: dict) -> str:
-        return f"data: {json.dumps(payload)}\n\n"
-
-    state = dict(_initial_state(address, postcode, user_id))
+    state = _initial_state(address, postcode, user_id)
     completed_parallel: set[str] = set()
+    save_task: asyncio.Task | None = None
 
     # PropertyValuationAgent always runs first — mark it running immediately
-    yield _sse({"type": "agent_start", "agent": "PropertyValuationAgent"})
+    yield _EVT_START["PropertyValuationAgent"]
 
     async for update in assessment_graph.astream(state, stream_mode="updates"):
         for node_name, node_output in update.items():
             # Merge into accumulated state
             if isinstance(node_output, dict):
-                state = _merge(state, node_output)
+                _merge(state, node_output)
 
             if node_name not in _AGENT_IDS:
                 continue
 
+            # Coalesce the events triggered by one node into a single yield —
+            # one write down the SSE response instead of one per event.
+            parts = [_EVT_END[node_name]]
+
             if node_name == "PropertyValuationAgent":
-                yield _sse({"type": "agent_end", "agent": "PropertyValuationAgent"})
                 # Fan-out: all three parallel agents start simultaneously
-                for a in _PARALLEL_AGENTS:
-                    yield _sse({"type": "agent_start", "agent": a})
+                parts.extend(_EVT_START[a] for a in _PARALLEL_AGENTS)
 
             elif node_name in _PARALLEL_AGENTS:
-                yield _sse({"type": "agent_end", "agent": node_name})
                 completed_parallel.add(node_name)
                 if completed_parallel >= _PARALLEL_AGENTS:
-                    yield _sse({"type": "agent_start", "agent": "PolicyAgent"})
+                    parts.append(_EVT_START["PolicyAgent"])
 
             elif node_name == "PolicyAgent":
-                yield _sse({"type": "agent_end", "agent": "PolicyAgent"})
-                yield _sse({"type": "agent_start", "agent": "CoordinatorAgent"})
+                parts.append(_EVT_START["CoordinatorAgent"])
 
             elif node_name == "CoordinatorAgent":
-                yield _sse({"type": "agent_end", "agent": "CoordinatorAgent"})
-                yield _sse({"type": "agent_start", "agent": "ExplainabilityAgent"})
+                parts.append(_EVT_START["ExplainabilityAgent"])
 
             elif node_name == "ExplainabilityAgent":
-                yield _sse({"type": "agent_end", "agent": "ExplainabilityAgent"})
+                # Terminal node — every channel is merged, so the Mongo
+                # writes can start now and overlap the stream winding down
+                # instead of adding their RTT after the last agent event.
+                save_task = asyncio.create_task(
+                    _save_and_build_response(state, address, postcode, user_id)
+                )
 
-    # Save to DB and emit final result
-    response = await _save_and_build_response(state, address, postcode, user_id)
+            yield "".join(parts)
+
+    # Emit final result (saving already in flight if the graph completed)
+    if save_task is None:
+        save_task = asyncio.create_task(
+            _save_and_build_response(state, address, postcode, user_id)
+        )
+    response = await save_task
     yield _sse({"type": "result", "data": response.model_dump()})
     yield "data: [DONE]\n\n"
 
 
-async def get_assessment_history(user_id: str) -> list[AssessmentResponse]:
-    assessments = await PropertyAssessment.find(
-        PropertyAssessment.user_id == PydanticObjectId(user_id)
-    ).to_list()
+class _HistoryBatcher:
+    """DataLoader-style coalescer for history reads.
+
+    Concurrent loads for distinct users inside a short tick window become a
+    single $in query, re-grouped per user — one Mongo round-trip instead of
+    one per user when a dashboard fans out. Same shape as the Bedrock
+    request batcher in the property valuation agent.
+    """
+
+    _WINDOW_S = 0.001
+    _MAX_BATCH = 64
+
+    def __init__(self) -> None:
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def load(self, user_id: str) -> list[AssessmentHistoryView]:
+        fut = self._pending.get(user_id)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._pending[user_id] = fut
+            if len(self._pending) >= self._MAX_BATCH:
+                self._flush_now()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._tick())
+        return await fut
+
+    def _flush_now(self) -> None:
+        pending, self._pending = self._pending, {}
+        asyncio.get_running_loop().create_task(self._resolve(pending))
+
+    async def _tick(self) -> None:
+        await asyncio.sleep(self._WINDOW_S)
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            await self._resolve(pending)
+
+    async def _resolve(self, pending: dict[str, asyncio.Future]) -> None:
+        try:
+            grouped = await get_assessment_histories_by_users(
+                [PydanticObjectId(u) for u in pending]
+            )
+        except Exception as e:
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for user_id, fut in pending.items():
+            if not fut.done():
+                fut.set_result(grouped.get(PydanticObjectId(user_id), []))
+
+
+_history_batcher = _HistoryBatcher()
+
+
+# History is read-dominant (the UI polls it, new assessments are rare), so
+# responses sit in a short per-user memo; finishing an assessment
+# invalidates the user's entry so a fresh run shows up immediately.
+_HISTORY_CACHE = AsyncTTLCache(maxsize=1024, ttl=60.0)
+
+
+async def get_assessment_history(user_id: str) -> list[dict]:
+    cached = _HISTORY_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+    async with _HISTORY_CACHE.lock(user_id):
+        cached = _HISTORY_CACHE.get(user_id)
+        if cached is not None:
+            return cached
+        responses = await _load_assessment_history(user_id)
+        _HISTORY_CACHE.put(user_id, responses)
+        return responses
+
+
+async def _load_assessment_history(user_id: str) -> list[dict]:
+    # Rows come straight off the DB projection and go straight back out, so
+    # they are shaped as plain dicts here (matching AssessmentResponse) —
+    # no pydantic construction per row, and the route hands the cached list
+    # to orjson without a re-validation pass.
+    assessments = await _history_batcher.load(user_id)
     return [
-        AssessmentResponse(
-            assessment_id=str(a.id),
-            decision=a.decision,
-            overall_risk_score=a.overall_risk_score,
-            premium_multiplier=a.premium_multiplier,
-            flood_risk_score=a.flood_risk_score,
-            planning_risk_score=a.planning_risk_score,
-            property_age_risk_score=a.property_age_risk_score,
-            locality_safety_score=a.locality_safety_score,
-            risk_factors=[
-                {"name": rf.name, "score": rf.score, "weight": rf.weight, "reasoning": rf.reasoning}
-                for rf in a.risk_factors
-            ],
-            plain_english_narrative=a.plain_english_narrative,
-            data_warnings=a.data_warnings,
-        )
+        {
+            "assessment_id": str(a.id),
+            "decision": a.decision,
+            "overall_risk_score": a.overall_risk_score,
+            "premium_multiplier": a.premium_multiplier,
+            "flood_risk_score": a.flood_risk_score,
+            "planning_risk_score": a.planning_risk_score,
+            "property_age_risk_score": a.property_age_risk_score,
+            "locality_safety_score": a.locality_safety_score,
+            "risk_factors": [rf.model_dump() for rf in a.risk_factors],
+            "plain_english_narrative": a.plain_english_narrative,
+            "data_warnings": a.data_warnings,
+            "property_details": None,
+        }
         for a in assessments
     ]
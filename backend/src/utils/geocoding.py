@@ -1,14 +1,54 @@
 import httpx
 
+from src.agents.cache import AsyncTTLCache
+
+_HEADERS = {"User-Agent": "Aurea-Underwriting/1.0"}
+
+# Shared client: a fresh AsyncClient per call pays TCP + TLS handshake to
+# Nominatim (~100-300 ms) every time; a module-level pool keeps connections
+# alive across calls. Closed from the app lifespan alongside the agents'
+# shared client.
+_client: httpx.AsyncClient | None = None
+
+# Addresses don't move — cache successful lookups for 30 days so repeat
+# geocodes of the same address skip the network entirely.
+_CACHE = AsyncTTLCache(maxsize=1024, ttl=30 * 86400.0)
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            headers=_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def aclose_geocoding_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def geocode_address(address: str) -> tuple[float | None, float | None]:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(
+    key = address.strip().lower()
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+    async with _CACHE.lock(key):
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+        resp = await _get_client().get(
             "https://nominatim.openstreetmap.org/search",
             params={"q": address, "format": "json", "limit": 1},
-            headers={"User-Agent": "Aurea-Underwriting/1.0"},
         )
         data = resp.json()
         if data:
-            return float(data[0]["lat"]), float(data[0]["lon"])
+            coords = (float(data[0]["lat"]), float(data[0]["lon"]))
+            _CACHE.put(key, coords)
+            return coords
     return None, None